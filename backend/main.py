@@ -1,28 +1,35 @@
 import asyncio
+import bisect
+import functools
+import hashlib
+import heapq
 import json
 import os
 import re
 import time
 import uuid
-from collections import deque
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from itertools import islice
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import List, Optional
-from urllib.parse import unquote
+from urllib.parse import quote, unquote
 
+import anyio.to_thread
 import html2text
 import httpx
+import orjson
 from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Response
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 from urllib.parse import urlparse
 
-# Load .env from the same directory as this file
-load_dotenv(Path(__file__).parent / ".env")
-
-app = FastAPI(title="10xGrokipedia API")
+# orjson serializes responses ~3-8x faster than the stdlib encoder
+app = FastAPI(title="10xGrokipedia API", default_response_class=ORJSONResponse)
 
 # CORS: allow all origins for local/dev use (frontend talks to http://localhost:8000)
 app.add_middleware(
@@ -35,14 +42,17 @@ app.add_middleware(
 
 CURRENT_DIR = Path(__file__).resolve().parent
 ROOT_DIR = CURRENT_DIR.parent
-DATA_FILE = Path(__file__).parent / "all_articles_short.json"
-CITATION_EVALUATIONS_FILE = Path(__file__).parent / "citation_bias_evaluations.json"
+CITATION_EVALUATIONS_FILE = CURRENT_DIR / "citation_bias_evaluations.json"
 
-# Load env files (root .env first, then backend/.env to allow local overrides)
-load_dotenv(ROOT_DIR / ".env")
+# Load env files once: backend/.env first so local values win (load_dotenv
+# defaults to override=False), then the repo root .env
 load_dotenv(CURRENT_DIR / ".env")
+load_dotenv(ROOT_DIR / ".env")
 
 DATA_FILE = CURRENT_DIR / "all_articles_short.json"
+# Per-article edits layered over DATA_FILE so applying a suggestion rewrites
+# one article's file instead of the whole corpus
+OVERRIDES_DIR = CURRENT_DIR / "articles_overrides"
 
 # Community Feed config with env overrides
 CACHE_TTL_SECONDS = int(os.getenv("TWEETS_CACHE_TTL", "90"))  # default 90s
@@ -51,29 +61,146 @@ RATE_LIMIT_WINDOW_SECONDS = int(os.getenv("TWEETS_RATE_WINDOW", "60"))  # defaul
 RATE_LIMIT_MAX_REQUESTS = int(os.getenv("TWEETS_RATE_MAX", "20"))  # default 20 reqs/min
 TRENDING_HOURS = int(os.getenv("TWEETS_TRENDING_HOURS", "168"))  # default 7d (168h)
 TRENDING_TOP_K = int(os.getenv("TWEETS_TRENDING_TOP_K", "3"))  # default top 3
+_TRENDING_TOP_K_EFF = max(1, TRENDING_TOP_K)  # clamped once, used per tweet
 # Preview flags (optional): force trending for top-N or specific ranks (1-based)
 TRENDING_PREVIEW_TOP_K = int(os.getenv("TWEETS_TRENDING_PREVIEW_TOP_K", "0"))
 _TPR = os.getenv("TWEETS_TRENDING_PREVIEW_RANKS", "").strip()
-TRENDING_PREVIEW_RANKS = {int(x) for x in _TPR.split(',') if x.strip().isdigit()} if _TPR else set()
+TRENDING_PREVIEW_RANKS = frozenset(int(x) for x in _TPR.split(',') if x.strip().isdigit()) if _TPR else frozenset()
 VERIFIED_BOOST = float(os.getenv("TWEETS_VERIFIED_BOOST", "1.1"))  # 10% lift by default
-
-
-
-# In-memory cache and simple global rate limiter
-_tweets_cache: dict[str, tuple[float, list["TweetItem"]]] = {}
-_summary_cache: dict[str, tuple[float, List[str]]] = {}
-_cache_lock = asyncio.Lock()
+GROK_RERANK_POOL = int(os.getenv("TWEETS_RERANK_POOL", "8"))  # candidates sent to the LLM reranker
+
+
+
+# In-memory caches and simple global rate limiter. The caches are read and
+# written without a lock: all handlers run on one event loop and no await
+# sits between a lookup and the matching mutation, so plain dict ops can't
+# interleave. Only the upstream rate limiter keeps a lock (its check spans awaits).
+_TWEETS_CACHE_MAX = 1024
+_SUMMARY_CACHE_MAX = 256
+_tweets_cache: OrderedDict[str, tuple[float, list["TweetItem"]]] = OrderedDict()
+_summary_cache: OrderedDict[str, tuple[float, List[str]]] = OrderedDict()
+# Secondary index: query -> cache keys, so invalidation avoids scanning every key
+_query_index: dict[str, set[str]] = {}
+
+
+def _index_cache_key(query: str, key: str) -> None:
+    """Record a tweets/summary cache key under its query for O(1) invalidation."""
+    _query_index.setdefault(query, set()).add(key)
+
+
+def _unindex_cache_key(key: str) -> None:
+    """Drop an evicted key from the query index once no cache references it."""
+    if key in _tweets_cache or key in _summary_cache:
+        return  # still live in the other cache; refresh must keep finding it
+    query = key[2:key.rfind("|n=")]  # keys are built as f"q={query}|n={max_results}"
+    keys = _query_index.get(query)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del _query_index[query]
+
+
+def _cache_put(cache: OrderedDict, key: str, value, max_entries: int) -> None:
+    """Insert into a bounded cache, evicting least-recently-used entries."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > max_entries:
+        evicted, _ = cache.popitem(last=False)
+        _unindex_cache_key(evicted)
 _rate_lock = asyncio.Lock()
-_rate_calls: deque[float] = deque()
+# Token bucket for upstream X API calls: refills continuously at
+# MAX/WINDOW per second, capped at MAX, one token consumed per call
+_rl_tokens: float = float(RATE_LIMIT_MAX_REQUESTS)
+_rl_last: float = time.monotonic()
 SUGGESTIONS_FILE = Path(__file__).parent / "suggestions.json"
 GROK_API_KEY = os.getenv("GROK_API_KEY")
 _inflight_tasks: dict[str, asyncio.Task] = {}
 
+async def _reserve_rate_slot() -> bool:
+    """Reserve one upstream X API call from the token bucket; False when drained."""
+    global _rl_tokens, _rl_last
+    async with _rate_lock:
+        now = time.monotonic()
+        _rl_tokens = min(
+            float(RATE_LIMIT_MAX_REQUESTS),
+            _rl_tokens + (now - _rl_last) * (RATE_LIMIT_MAX_REQUESTS / RATE_LIMIT_WINDOW_SECONDS),
+        )
+        _rl_last = now
+        if _rl_tokens < 1.0:
+            return False
+        _rl_tokens -= 1.0
+        return True
+
+
+# Shared HTTP client: keep-alive + HTTP/2 avoids a fresh TCP/TLS handshake per
+# upstream call (X API, Grok, article previews).
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=15.0,
+            # Keep idle connections around well past httpx's 5s default so bursty
+            # traffic keeps reusing warm sockets instead of re-handshaking
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=128,
+                keepalive_expiry=75.0,
+            ),
+        )
+    return _http_client
+
+
+@app.on_event("startup")
+async def _open_http_client() -> None:
+    client = _get_http_client()
+    # Warm a keep-alive connection to the Grok API so the first real request
+    # doesn't pay the TCP+TLS handshake; best-effort only.
+    try:
+        await client.get(
+            "https://api.x.ai/v1/models",
+            headers={"Authorization": f"Bearer {GROK_API_KEY}"},
+            timeout=5.0,
+        )
+    except httpx.HTTPError:
+        pass
+
+
+@app.on_event("startup")
+async def _warm_caches() -> None:
+    """Parse the data files while uvicorn is still warming.
+
+    The first request would otherwise pay the full corpus parse; doing it at
+    boot also surfaces a corrupt file immediately instead of on a user hit.
+    """
+    await anyio.to_thread.run_sync(load_data)
+    await anyio.to_thread.run_sync(load_suggestions)
+    try:
+        await anyio.to_thread.run_sync(load_citation_evaluations)
+    except HTTPException:
+        # Evaluations file is optional at boot; the endpoint reports its absence
+        pass
+
+
+@app.on_event("shutdown")
+async def _close_http_client() -> None:
+    if _http_client is not None:
+        await _http_client.aclose()
+
 if not GROK_API_KEY:
     print("WARNING: GROK_API_KEY not found in .env file!")
 else:
     print(f"GROK_API_KEY loaded: {GROK_API_KEY[:15]}...")
 
+# Built once so each request reuses the same header dict (and its encoded form)
+_GROK_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": f"Bearer {GROK_API_KEY}",
+}
+
 
 # --- Models ---
 
@@ -160,50 +287,251 @@ def extract_slug(url: str) -> str:
     return url.split("/page/")[-1] if "/page/" in url else url
 
 
+# Keys: mtime_ns, size, data, slug_index, summaries (prebuilt TopicSummary rows),
+# titles_lower / slugs_lower (parallel pre-lowered arrays for substring search)
+_data_cache: dict | None = None
+# (mtime_ns, size, parsed suggestions, {slug: pending count})
+_suggestions_cache: tuple[int, int, dict, dict[str, int]] | None = None
+
+
+def _load_data_index() -> dict:
+    """Parse the articles file once per file version and build derived indexes.
+
+    Warm requests hit the in-memory copy instead of re-reading and re-parsing the
+    whole corpus; slug lookups and search scans use the precomputed structures.
+    """
+    global _data_cache
+    st = DATA_FILE.stat()
+    cache = _data_cache
+    if cache is not None and cache["mtime_ns"] == st.st_mtime_ns and cache["size"] == st.st_size:
+        return cache
+    with open(DATA_FILE, "rb") as f:
+        data = orjson.loads(f.read())
+    slugs = [extract_slug(a['url']) for a in data]
+    slug_index = dict(zip(slugs, data))
+    # Layer per-article edits over the base corpus (see apply_suggestion)
+    if OVERRIDES_DIR.is_dir():
+        for path in OVERRIDES_DIR.glob("*.json"):
+            article = slug_index.get(unquote(path.stem))
+            if article is not None:
+                article.update(orjson.loads(path.read_bytes()))
+    cache = {
+        "mtime_ns": st.st_mtime_ns,
+        "size": st.st_size,
+        "data": data,
+        "slug_index": slug_index,
+        # model_construct: two trusted strings per row, validation adds nothing
+        "summaries": [
+            TopicSummary.model_construct(topic=slug, title=a['title'])
+            for slug, a in zip(slugs, data)
+        ],
+        "titles_lower": [a['title'].lower() for a in data],
+        "slugs_lower": [slug.lower() for slug in slugs],
+        # Pre-serialized /api/topics body: the full list is static per file
+        # version, so the endpoint can skip model validation and encoding
+        "summaries_json": orjson.dumps(
+            [{"topic": slug, "title": a['title']} for slug, a in zip(slugs, data)]
+        ),
+    }
+    _data_cache = cache
+    return cache
+
+
 def load_data() -> list[dict]:
     """Load articles as dictionaries to preserve all fields including citations."""
-    with open(DATA_FILE) as f:
-        return json.load(f)
+    return _load_data_index()["data"]
 
 
-def load_suggestions() -> dict:
+def get_article_by_slug(slug: str) -> dict | None:
+    """O(1) article lookup via the slug index built alongside the cached data."""
+    return _load_data_index()["slug_index"].get(slug)
+
+
+@functools.lru_cache(maxsize=4096)
+def _norm_url(u: str) -> str:
+    """Case/trailing-slash normalization for citation URLs, memoized per input."""
+    return u.casefold().rstrip('/')
+
+
+@dataclass(slots=True, frozen=True)
+class EvalRow:
+    """Flattened per-citation scores, extracted once at evaluations load time."""
+    factual_score: float | None
+    bias_score: float | None
+
+
+# Keys: mtime, evaluations, normalized (url -> original key), sorted_keys,
+# rows (original key -> EvalRow), bias_blobs (original key -> response bytes)
+_evaluations_cache: dict | None = None
+
+
+def load_citation_evaluations() -> dict:
+    """Load citation evaluations plus derived indexes, cached by file mtime.
+
+    Normalizing keys once at load time turns the per-request case/slash-insensitive
+    fallback scan into a single dict probe, and pre-serializing the citation-bias
+    responses means the read-hot endpoint skips Pydantic entirely.
+    """
+    global _evaluations_cache
+    try:
+        mtime = CITATION_EVALUATIONS_FILE.stat().st_mtime
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=500,
+            detail="Citation evaluations file not found"
+        )
+    if _evaluations_cache is None or _evaluations_cache["mtime"] != mtime:
+        with open(CITATION_EVALUATIONS_FILE, 'rb') as f:
+            raw = f.read()
+        evaluations = orjson.loads(raw)
+        # casefold rather than lower for correct matching of non-ASCII URLs;
+        # drop memoized normalizations from any previous file version
+        _norm_url.cache_clear()
+        normalized = {_norm_url(k): k for k in evaluations}
+        rows: dict[str, EvalRow] = {}
+        bias_blobs: dict[str, bytes] = {}
+        for key, entry in evaluations.items():
+            article_eval = entry.get('evaluation', {}).get('article', {})
+            factual_score = article_eval.get('factual_reporting', {}).get('overall_score')
+            bias_score = article_eval.get('bias', {}).get('overall_score')
+            rows[key] = EvalRow(factual_score=factual_score, bias_score=bias_score)
+            factual = factual_score if factual_score is not None else 0.0
+            bias = bias_score if bias_score is not None else 0.0
+            bias_blobs[key] = orjson.dumps({
+                "citation_url": key,
+                "factual_score": round(factual, 1),
+                "factual_label": get_factual_label(factual),
+                "bias_score": round(bias, 1),
+                "bias_label": get_bias_label(bias),
+            })
+        _evaluations_cache = {
+            "mtime": mtime,
+            "evaluations": evaluations,
+            "normalized": normalized,
+            "sorted_keys": sorted(normalized),
+            "rows": rows,
+            "bias_blobs": bias_blobs,
+            # Content version for ETag validation; changes only when the file does
+            "version": hashlib.sha256(raw).hexdigest()[:16],
+        }
+    return _evaluations_cache
+
+
+def _load_suggestions_cache() -> tuple[int, int, dict, dict[str, int]] | None:
+    global _suggestions_cache
     if not SUGGESTIONS_FILE.exists():
-        return {}
-    with open(SUGGESTIONS_FILE) as f:
-        return json.load(f)
+        return None
+    st = SUGGESTIONS_FILE.stat()
+    cache = _suggestions_cache
+    if cache is not None and cache[0] == st.st_mtime_ns and cache[1] == st.st_size:
+        return cache
+    with open(SUGGESTIONS_FILE, "rb") as f:
+        data = orjson.loads(f.read())
+    pending_counts = {
+        slug: sum(1 for s in slist if s["status"] == "pending")
+        for slug, slist in data.items()
+    }
+    _suggestions_cache = (st.st_mtime_ns, st.st_size, data, pending_counts)
+    return _suggestions_cache
+
+
+def load_suggestions() -> dict:
+    cache = _load_suggestions_cache()
+    return cache[2] if cache is not None else {}
+
+
+def _utc_now_iso() -> str:
+    """UTC timestamp in the `...Z` form stored throughout the JSON files.
+
+    datetime.utcnow() is deprecated since 3.12; a single aware now() call
+    also skips the naive-object detour and one string concat.
+    """
+    return datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z')
+
+
+def _write_json_atomic(path: Path, payload) -> None:
+    """Serialize to a sibling tmp file and rename it over the target.
+
+    os.replace is atomic on POSIX, so readers never observe a torn file even
+    if the process dies mid-write.
+    """
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, path)
+
+
+def _write_article_override(slug: str, article: dict) -> None:
+    """Persist one edited article as an override file layered over DATA_FILE."""
+    OVERRIDES_DIR.mkdir(exist_ok=True)
+    _write_json_atomic(OVERRIDES_DIR / f"{quote(slug, safe='')}.json", article)
+
 
+def _save_suggestions_sync(data: dict) -> None:
+    global _suggestions_cache
+    _write_json_atomic(SUGGESTIONS_FILE, data)
+    _suggestions_cache = None
 
-def save_suggestions(data: dict):
-    with open(SUGGESTIONS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+
+async def save_suggestions(data: dict) -> None:
+    """Persist suggestions off the event loop so the write can't stall it."""
+    await anyio.to_thread.run_sync(_save_suggestions_sync, data)
 
 
 def get_suggestion_count(topic_slug: str) -> int:
-    suggestions = load_suggestions()
-    topic_suggestions = suggestions.get(topic_slug, [])
-    return len([s for s in topic_suggestions if s["status"] == "pending"])
+    cache = _load_suggestions_cache()
+    return cache[3].get(topic_slug, 0) if cache is not None else 0
+
+
+# Built once at import so normalize_quotes is a single C-level translate pass
+# instead of one str.replace scan (and intermediate copy) per smart character.
+_QUOTE_TABLE = str.maketrans({
+    '\u2018': "'",  # '
+    '\u2019': "'",  # '
+    '\u201C': '"',  # "
+    '\u201D': '"',  # "
+    '\u2013': '-',  # –
+    '\u2014': '-',  # —
+})
 
 
 def normalize_quotes(text: str) -> str:
     """Normalize smart quotes to regular quotes for matching."""
-    replacements = {
-        '\u2018': "'",  # '
-        '\u2019': "'",  # '
-        '\u201C': '"',  # "
-        '\u201D': '"',  # "
-        '\u2013': '-',  # –
-        '\u2014': '-',  # —
-    }
-    for smart, regular in replacements.items():
-        text = text.replace(smart, regular)
-    return text
+    return text.translate(_QUOTE_TABLE)
+
+
+# Compiled once at import: [text](url) links and a trailing ](url) fragment
+_MD_LINK_SUB_RE = re.compile(r'\[([^\]]*)\]\([^)]+\)')
+_MD_LINK_TAIL_RE = re.compile(r'^[^\[\]]*\]\([^)]*\)')
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_first_json_object(text: str):
+    """Pull the first JSON object out of a chatty model reply.
+
+    raw_decode handles nested braces and braces inside string values,
+    which a flat regex cannot. Returns None if nothing parses.
+    """
+    idx = text.find("{")
+    while idx != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, idx)
+            if isinstance(obj, dict):
+                return obj
+        except ValueError:
+            pass
+        idx = text.find("{", idx + 1)
+    return None
 
 
 def strip_markdown_links(text: str) -> str:
     """Convert [text](url) markdown links to just text for matching."""
+    # No bracket means no link: skip the regex pass (C-level memchr check)
+    if '[' not in text:
+        return text
     # Replace [text](url) with just text, and [](url) with nothing
-    result = re.sub(r'\[([^\]]*)\]\([^)]+\)', r'\1', text)
-    return result
+    return _MD_LINK_SUB_RE.sub(r'\1', text)
 
 
 def find_and_replace_fuzzy(content: str, highlighted: str, replacement: str) -> str | None:
@@ -212,6 +540,14 @@ def find_and_replace_fuzzy(content: str, highlighted: str, replacement: str) ->
     norm_highlighted = normalize_quotes(highlighted)
     norm_content = normalize_quotes(content)
 
+    # Fast path: no markdown link syntax anywhere, so stripping is a no-op and
+    # positions in norm_content are positions in content
+    if '[' not in norm_content:
+        idx = norm_content.find(norm_highlighted)
+        if idx == -1:
+            return None
+        return content[:idx] + replacement + content[idx + len(norm_highlighted):]
+
     # Also strip markdown links for comparison
     stripped_content = strip_markdown_links(norm_content)
     stripped_highlighted = strip_markdown_links(norm_highlighted)
@@ -221,53 +557,52 @@ def find_and_replace_fuzzy(content: str, highlighted: str, replacement: str) ->
     if stripped_idx == -1:
         return None
 
-    # Build a mapping from stripped positions to original positions
-    # For each character in stripped content, track where it came from in original
-    stripped_to_original = []
-    orig_i = 0
-
-    while orig_i < len(norm_content):
-        if norm_content[orig_i] == '[':
-            # Check if this is a markdown link
-            bracket_end = norm_content.find(']', orig_i)
-            if bracket_end != -1:
-                paren_start = bracket_end + 1
-                if paren_start < len(norm_content) and norm_content[paren_start] == '(':
-                    paren_end = norm_content.find(')', paren_start)
-                    if paren_end != -1:
-                        # This is a markdown link [text](url) or [](url)
-                        # The link text maps to stripped content
-                        link_text = norm_content[orig_i+1:bracket_end]
-                        if len(link_text) > 0:
-                            for j in range(len(link_text)):
-                                stripped_to_original.append(orig_i + 1 + j)
-                        # Skip entire link syntax (empty links [](url) are completely removed)
-                        orig_i = paren_end + 1
-                        continue
-
-        # Regular character
-        stripped_to_original.append(orig_i)
-        orig_i += 1
+    # Build a mapping from stripped positions to original positions as segment
+    # anchors: one (stripped_offset, original_offset, length) tuple per plain run
+    # and per link text, instead of a per-character index for the whole article.
+    # Uses the same compiled regex as strip_markdown_links so both views agree.
+    segments: list[tuple[int, int, int]] = []
+    strip_pos = 0
+    orig_pos = 0
+    for m in _MD_LINK_SUB_RE.finditer(norm_content):
+        if m.start() > orig_pos:
+            run = m.start() - orig_pos
+            segments.append((strip_pos, orig_pos, run))
+            strip_pos += run
+        # Link text survives stripping; the [](url) syntax around it does not
+        text_len = len(m.group(1))
+        if text_len:
+            segments.append((strip_pos, m.start(1), text_len))
+            strip_pos += text_len
+        orig_pos = m.end()
+    if orig_pos < len(norm_content):
+        segments.append((strip_pos, orig_pos, len(norm_content) - orig_pos))
+        strip_pos += len(norm_content) - orig_pos
 
     # Now map the found position back to original
-    if stripped_idx >= len(stripped_to_original):
+    if stripped_idx >= strip_pos or not segments:
         return None
 
-    original_start = stripped_to_original[stripped_idx]
+    strip_starts = [seg[0] for seg in segments]
+
+    def _to_original(idx: int) -> int:
+        j = bisect.bisect_right(strip_starts, idx) - 1
+        seg_strip, seg_orig, seg_len = segments[j]
+        return seg_orig + min(idx - seg_strip, seg_len - 1)
+
+    original_start = _to_original(stripped_idx)
 
     # For the end position, we need to find where the highlighted text ends
-    end_stripped_idx = stripped_idx + len(stripped_highlighted) - 1
-    if end_stripped_idx >= len(stripped_to_original):
-        end_stripped_idx = len(stripped_to_original) - 1
+    end_stripped_idx = min(stripped_idx + len(stripped_highlighted) - 1, strip_pos - 1)
 
-    original_end = stripped_to_original[end_stripped_idx] + 1
+    original_end = _to_original(end_stripped_idx) + 1
 
     # Extend to include any trailing markdown link that we might be in the middle of
     # Check if we're ending inside a markdown link's text
     remaining = norm_content[original_end:]
     if remaining:
         # Look for pattern ](url) which would indicate we're in a link
-        match = re.match(r'^[^\[\]]*\]\([^)]*\)', remaining)
+        match = _MD_LINK_TAIL_RE.match(remaining)
         if match:
             original_end += match.end()
 
@@ -277,27 +612,33 @@ def find_and_replace_fuzzy(content: str, highlighted: str, replacement: str) ->
 
 # --- Static Topic Endpoints (must come first) ---
 
-@app.get("/api/topics")
-def get_topics() -> list[TopicSummary]:
+@app.get("/api/topics", response_model=list[TopicSummary])
+async def get_topics() -> Response:
     """Get all topics (for search)."""
-    data = load_data()
-    return [
-        TopicSummary(topic=extract_slug(a['url']), title=a['title'])
-        for a in data
-    ]
+    # Serve the bytes encoded once per file version; skips per-request
+    # serialization of the whole summary list
+    return Response(content=_load_data_index()["summaries_json"], media_type="application/json")
 
 
 @app.get("/api/topics/search")
-def search_topics(q: str = "") -> list[TopicSummary]:
-    """Search topics by query string."""
-    data = load_data()
+async def search_topics(q: str = "", limit: int = 50, offset: int = 0) -> list[TopicSummary]:
+    """Search topics by query string. Results are paginated via limit/offset."""
+    limit = max(1, min(limit, 200))
+    offset = max(0, offset)
+    index = _load_data_index()
+    summaries = index["summaries"]
     query = q.lower()
-    results = [
-        TopicSummary(topic=extract_slug(a['url']), title=a['title'])
-        for a in data
-        if query in a['title'].lower() or query in extract_slug(a['url']).lower()
-    ]
-    return results
+    if not query:
+        return summaries[offset:offset + limit]
+    titles_lower = index["titles_lower"]
+    slugs_lower = index["slugs_lower"]
+    # Generator + islice stops scanning once the requested page is filled
+    hits = (
+        summaries[i]
+        for i in range(len(summaries))
+        if query in titles_lower[i] or query in slugs_lower[i]
+    )
+    return list(islice(hits, offset, offset + limit))
 
 
 # --- Suggestion Endpoints (must come BEFORE catch-all topic route) ---
@@ -305,7 +646,7 @@ def search_topics(q: str = "") -> list[TopicSummary]:
 # the generic POST route because {topic_slug:path} is greedy and captures everything.
 
 @app.get("/api/suggestions/{topic_slug:path}")
-def get_suggestions(topic_slug: str) -> list[SuggestionResponse]:
+async def get_suggestions(topic_slug: str) -> list[SuggestionResponse]:
     """Get all suggestions for a topic."""
     decoded_slug = unquote(topic_slug)
     suggestions = load_suggestions()
@@ -333,12 +674,8 @@ async def review_suggestion(topic_slug: str, suggestion_id: str) -> ReviewResult
         raise HTTPException(status_code=404, detail="Suggestion not found")
 
     # Get article content
-    data = load_data()
-    article_content = None
-    for a in data:
-        if extract_slug(a.url) == decoded_slug:
-            article_content = a.content
-            break
+    article = get_article_by_slug(decoded_slug)
+    article_content = article["content"] if article else None
 
     if not article_content:
         raise HTTPException(status_code=404, detail="Article not found")
@@ -373,67 +710,176 @@ Respond in JSON format:
 }}"""
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.x.ai/v1/chat/completions",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {GROK_API_KEY}"
-                },
-                json={
-                    "messages": [
-                        {"role": "system", "content": "You are a fact-checking assistant for an encyclopedia. Always respond with valid JSON."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    "model": "grok-3-latest",
-                    "stream": False,
-                    "temperature": 0
-                },
-                timeout=60.0
-            )
-            response.raise_for_status()
-            result = response.json()
+        client = _get_http_client()
+        response = await client.post(
+            "https://api.x.ai/v1/chat/completions",
+            headers=_GROK_HEADERS,
+            json={
+                "messages": [
+                    {"role": "system", "content": "You are a fact-checking assistant for an encyclopedia. Always respond with valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                "model": "grok-3-latest",
+                "stream": False,
+                "temperature": 0
+            },
+            timeout=60.0
+        )
+        response.raise_for_status()
+        result = orjson.loads(response.content)
 
-            # Parse the response
-            content = result["choices"][0]["message"]["content"]
-            # Try to extract JSON from the response
-            try:
-                review_data = json.loads(content)
-            except json.JSONDecodeError:
-                # Try to find JSON in the response
-                json_match = re.search(r'\{[^{}]*\}', content, re.DOTALL)
-                if json_match:
-                    review_data = json.loads(json_match.group())
-                else:
-                    review_data = {
-                        "approved": False,
-                        "reasoning": "Failed to parse AI response",
-                        "suggested_content": None
-                    }
-
-            review_result = ReviewResult(
-                approved=review_data.get("approved", False),
-                reasoning=review_data.get("reasoning", ""),
-                suggested_content=review_data.get("suggested_content")
-            )
+        # Parse the response
+        content = result["choices"][0]["message"]["content"]
+        # Try to extract JSON from the response
+        try:
+            review_data = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Try to find JSON in the response
+            review_data = _extract_first_json_object(content)
+            if review_data is None:
+                review_data = {
+                    "approved": False,
+                    "reasoning": "Failed to parse AI response",
+                    "suggested_content": None
+                }
+
+        review_result = ReviewResult(
+            approved=review_data.get("approved", False),
+            reasoning=review_data.get("reasoning", ""),
+            suggested_content=review_data.get("suggested_content")
+        )
+
+        # Update suggestion status
+        suggestion["status"] = "reviewed"
+        suggestion["review_result"] = {
+            "approved": review_result.approved,
+            "reasoning": review_result.reasoning,
+            "suggested_content": review_result.suggested_content
+        }
+        await save_suggestions(suggestions)
+
+        return review_result
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Grok API error: {str(e)}")
+
+
+class BatchReviewItem(BaseModel):
+    suggestion_id: str
+    result: ReviewResult
 
-            # Update suggestion status
-            suggestion["status"] = "reviewed"
-            suggestion["review_result"] = {
-                "approved": review_result.approved,
-                "reasoning": review_result.reasoning,
-                "suggested_content": review_result.suggested_content
-            }
-            save_suggestions(suggestions)
 
-            return review_result
+@app.post("/api/suggestions/{topic_slug:path}/review_batch")
+async def review_suggestions_batch(topic_slug: str, limit: int = 5) -> list[BatchReviewItem]:
+    """Review up to `limit` pending suggestions for a topic in one Grok call.
+
+    A single numbered prompt amortizes the round trip across the batch
+    instead of paying a full completion per suggestion.
+    """
+    decoded_slug = unquote(topic_slug)
+    suggestions = load_suggestions()
+
+    if decoded_slug not in suggestions:
+        raise HTTPException(status_code=404, detail="Topic not found")
+
+    pending = [s for s in suggestions[decoded_slug] if s["status"] == "pending"]
+    pending = pending[:max(1, min(limit, 10))]
+    if not pending:
+        return []
+
+    article = get_article_by_slug(decoded_slug)
+    article_content = article["content"] if article else None
+    if not article_content:
+        raise HTTPException(status_code=404, detail="Article not found")
+
+    items_block = "\n\n".join(
+        f"SUGGESTION {i} (id: {s['id']}):\n"
+        f"HIGHLIGHTED TEXT TO EDIT:\n{s['highlighted_text']}\n"
+        f"USER'S SUGGESTED CHANGE:\n{s['summary']}\n"
+        "SUPPORTING SOURCES:\n" + ("\n".join(s["sources"]) if s["sources"] else "No sources provided")
+        for i, s in enumerate(pending, start=1)
+    )
+
+    prompt = f"""You are reviewing suggested edits for an encyclopedia article.
+
+CURRENT ARTICLE CONTENT:
+{article_content[:3000]}
+
+{items_block}
+
+Evaluate each suggestion independently. Consider:
+1. Is the suggested change factually accurate?
+2. Do the sources support the change?
+3. Does it improve the article?
+
+Respond with ONLY a JSON array holding one object per suggestion, in order:
+[{{"id": "<suggestion id>", "approved": true/false, "reasoning": "Brief explanation", "suggested_content": "corrected text if approved, else null"}}]"""
 
+    try:
+        client = _get_http_client()
+        response = await client.post(
+            "https://api.x.ai/v1/chat/completions",
+            headers=_GROK_HEADERS,
+            json={
+                "messages": [
+                    {"role": "system", "content": "You are a fact-checking assistant for an encyclopedia. Always respond with valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                "model": "grok-3-latest",
+                "stream": False,
+                "temperature": 0
+            },
+            timeout=90.0
+        )
+        response.raise_for_status()
+        content = orjson.loads(response.content)["choices"][0]["message"]["content"]
+        try:
+            verdicts = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Be robust to minor pre/post text around the array
+            start = content.find("[")
+            end = content.rfind("]")
+            if start == -1 or end <= start:
+                raise HTTPException(status_code=502, detail="Failed to parse AI batch response")
+            verdicts = orjson.loads(content[start:end + 1])
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Grok API error: {str(e)}")
 
+    if not isinstance(verdicts, list):
+        raise HTTPException(status_code=502, detail="Failed to parse AI batch response")
+
+    # Match verdicts back by id, falling back to prompt order
+    by_id = {str(v.get("id")): v for v in verdicts if isinstance(v, dict)}
+    results: list[BatchReviewItem] = []
+    for i, s in enumerate(pending):
+        v = by_id.get(s["id"])
+        if v is None and i < len(verdicts) and isinstance(verdicts[i], dict):
+            v = verdicts[i]
+        if v is None:
+            continue
+        result = ReviewResult(
+            approved=bool(v.get("approved", False)),
+            reasoning=str(v.get("reasoning", "")),
+            suggested_content=v.get("suggested_content") or None,
+        )
+        s["status"] = "reviewed"
+        s["review_result"] = {
+            "approved": result.approved,
+            "reasoning": result.reasoning,
+            "suggested_content": result.suggested_content,
+        }
+        results.append(BatchReviewItem(suggestion_id=s["id"], result=result))
+
+    if results:
+        await save_suggestions(suggestions)
+
+    return results
+
 
 @app.post("/api/suggestions/{topic_slug:path}/apply/{suggestion_id}")
-def apply_suggestion(topic_slug: str, suggestion_id: str):
+async def apply_suggestion(topic_slug: str, suggestion_id: str):
     """Apply an approved suggestion to the article."""
     decoded_slug = unquote(topic_slug)
     suggestions = load_suggestions()
@@ -457,47 +903,46 @@ def apply_suggestion(topic_slug: str, suggestion_id: str):
     if not suggestion["review_result"] or not suggestion["review_result"].get("approved"):
         raise HTTPException(status_code=400, detail="Suggestion was not approved")
 
-    # Load and update article
-    with open(DATA_FILE) as f:
-        articles = json.load(f)
-
-    for article in articles:
-        if extract_slug(article["url"]) == decoded_slug:
-            # Save version history
-            if "versions" not in article:
-                article["versions"] = []
-            article["versions"].append({
-                "content": article["content"],
-                "timestamp": datetime.utcnow().isoformat() + "Z"
-            })
-
-            # Apply the change
-            suggested_content = suggestion["review_result"]["suggested_content"]
-            if suggested_content:
-                highlighted = suggestion["highlighted_text"]
-                # Try exact match first
-                if highlighted in article["content"]:
-                    article["content"] = article["content"].replace(highlighted, suggested_content)
-                else:
-                    # Try fuzzy matching (handles smart quotes and markdown links)
-                    new_content = find_and_replace_fuzzy(article["content"], highlighted, suggested_content)
-                    if new_content:
-                        article["content"] = new_content
-            break
+    # Update the cached article in place; the data list and slug index share
+    # the same dicts, so every read path sees the edit immediately
+    article = get_article_by_slug(decoded_slug)
+    if article is not None:
+        # Save version history
+        if "versions" not in article:
+            article["versions"] = []
+        article["versions"].append({
+            "content": article["content"],
+            "timestamp": _utc_now_iso()
+        })
+
+        # Apply the change
+        suggested_content = suggestion["review_result"]["suggested_content"]
+        if suggested_content:
+            highlighted = suggestion["highlighted_text"]
+            # Try exact match first: one find + one splice instead of a
+            # membership scan followed by a full replace() pass
+            content = article["content"]
+            idx = content.find(highlighted)
+            if idx != -1:
+                article["content"] = content[:idx] + suggested_content + content[idx + len(highlighted):]
+            else:
+                # Try fuzzy matching (handles smart quotes and markdown links)
+                new_content = find_and_replace_fuzzy(content, highlighted, suggested_content)
+                if new_content:
+                    article["content"] = new_content
 
-    # Save updated articles
-    with open(DATA_FILE, "w") as f:
-        json.dump(articles, f, indent=2)
+        # Persist only the touched article, atomically and off the event loop
+        await anyio.to_thread.run_sync(_write_article_override, decoded_slug, article)
 
     # Mark suggestion as applied
     suggestion["status"] = "applied"
-    save_suggestions(suggestions)
+    await save_suggestions(suggestions)
 
     return {"message": "Suggestion applied successfully"}
 
 
 @app.post("/api/suggestions/{topic_slug:path}/reject/{suggestion_id}")
-def reject_suggestion(topic_slug: str, suggestion_id: str):
+async def reject_suggestion(topic_slug: str, suggestion_id: str):
     """Reject a suggestion."""
     decoded_slug = unquote(topic_slug)
     suggestions = load_suggestions()
@@ -508,7 +953,7 @@ def reject_suggestion(topic_slug: str, suggestion_id: str):
     for s in suggestions[decoded_slug]:
         if s["id"] == suggestion_id:
             s["status"] = "rejected"
-            save_suggestions(suggestions)
+            await save_suggestions(suggestions)
             return {"message": "Suggestion rejected"}
 
     raise HTTPException(status_code=404, detail="Suggestion not found")
@@ -516,7 +961,7 @@ def reject_suggestion(topic_slug: str, suggestion_id: str):
 
 # Generic submit route MUST come AFTER specific routes due to greedy :path
 @app.post("/api/suggestions/{topic_slug:path}")
-def submit_suggestion(topic_slug: str, suggestion: EditSuggestionInput) -> SuggestionResponse:
+async def submit_suggestion(topic_slug: str, suggestion: EditSuggestionInput) -> SuggestionResponse:
     """Submit a new edit suggestion for a topic."""
     decoded_slug = unquote(topic_slug)
     suggestions = load_suggestions()
@@ -531,11 +976,11 @@ def submit_suggestion(topic_slug: str, suggestion: EditSuggestionInput) -> Sugge
         "sources": suggestion.sources,
         "status": "pending",
         "review_result": None,
-        "created_at": datetime.utcnow().isoformat() + "Z"
+        "created_at": _utc_now_iso()
     }
 
     suggestions[decoded_slug].append(new_suggestion)
-    save_suggestions(suggestions)
+    await save_suggestions(suggestions)
 
     return SuggestionResponse(**new_suggestion)
 
@@ -554,36 +999,32 @@ class VersionDetail(BaseModel):
 
 
 @app.get("/api/topics/{topic_slug:path}/versions")
-def get_versions(topic_slug: str) -> list[VersionSummary]:
+async def get_versions(topic_slug: str) -> list[VersionSummary]:
     """Get version history for a topic."""
     decoded_slug = unquote(topic_slug)
-    data = load_data()
-
-    for a in data:
-        if extract_slug(a["url"]) == decoded_slug:
-            versions = []
-            for i, v in enumerate(a.get("versions", [])):
-                versions.append(VersionSummary(index=i, timestamp=v["timestamp"]))
-            return versions
+    a = get_article_by_slug(decoded_slug)
+    if a is None:
+        raise HTTPException(status_code=404, detail="Topic not found")
 
-    raise HTTPException(status_code=404, detail="Topic not found")
+    return [
+        VersionSummary(index=i, timestamp=v["timestamp"])
+        for i, v in enumerate(a.get("versions", []))
+    ]
 
 
 @app.get("/api/topics/{topic_slug:path}/versions/{version_index}")
-def get_version(topic_slug: str, version_index: int) -> VersionDetail:
+async def get_version(topic_slug: str, version_index: int) -> VersionDetail:
     """Get a specific version of a topic."""
     decoded_slug = unquote(topic_slug)
-    data = load_data()
-
-    for a in data:
-        if extract_slug(a['url']) == decoded_slug:
-            versions = a.get('versions', [])
-            if version_index < 0 or version_index >= len(versions):
-                raise HTTPException(status_code=404, detail="Version not found")
-            v = versions[version_index]
-            return VersionDetail(index=version_index, timestamp=v["timestamp"], content=v["content"])
+    a = get_article_by_slug(decoded_slug)
+    if a is None:
+        raise HTTPException(status_code=404, detail="Topic not found")
 
-    raise HTTPException(status_code=404, detail="Topic not found")
+    versions = a.get('versions', [])
+    if version_index < 0 or version_index >= len(versions):
+        raise HTTPException(status_code=404, detail="Version not found")
+    v = versions[version_index]
+    return VersionDetail(index=version_index, timestamp=v["timestamp"], content=v["content"])
 
 
 # ---- Community Feed Models (X/Twitter) ----
@@ -636,53 +1077,49 @@ async def get_topic_tweets(topic_slug: str, max_results: int = 10) -> list[Tweet
     # Build cache key based on normalized query and max_results
     key = f"q={query}|n={max_results}"
 
-    # Attempt to read from cache
+    # Attempt to read from cache (lockless: no await between lookup and use)
     now = time.time()
-    async with _cache_lock:
-        if key in _tweets_cache:
-            ts, items = _tweets_cache[key]
-            if now - ts < CACHE_TTL_SECONDS:
-                return items
-            else:
-                _tweets_cache.pop(key, None)
-
-        # Single-flight: if another request is already fetching, await it
-        if key in _inflight_tasks:
-            task = _inflight_tasks[key]
-            joiner = True
-        else:
-            # Rate limiting only for the creator of the task
-            async with _rate_lock:
-                while _rate_calls and (now - _rate_calls[0] > RATE_LIMIT_WINDOW_SECONDS):
-                    _rate_calls.popleft()
-                if len(_rate_calls) >= RATE_LIMIT_MAX_REQUESTS:
-                    # serve stale if available (even if expired)
-                    if key in _tweets_cache:
-                        return _tweets_cache[key][1]
-                    raise HTTPException(status_code=429, detail="Rate limit exceeded for tweets endpoint. Please try again later.")
-                _rate_calls.append(now)
+    entry = _tweets_cache.get(key)
+    if entry is not None:
+        ts, items = entry
+        if now - ts < CACHE_TTL_SECONDS:
+            _tweets_cache.move_to_end(key)
+            return items
+        _tweets_cache.pop(key, None)
+
+    # Single-flight: if another request is already fetching, await it
+    task = _inflight_tasks.get(key)
+    joiner = task is not None
+    if not joiner:
+        # Rate limiting only for the creator of the task
+        if not await _reserve_rate_slot():
+            # serve stale if available (even if expired)
+            if entry is not None:
+                return entry[1]
+            raise HTTPException(status_code=429, detail="Rate limit exceeded for tweets endpoint. Please try again later.")
+        # Re-check: the rate-slot await may have let another request register
+        task = _inflight_tasks.get(key)
+        joiner = task is not None
+        if not joiner:
             task = asyncio.create_task(_fetch_recent_top_tweets(query=query, return_count=max_results))
             _inflight_tasks[key] = task
-            joiner = False
 
-    # Await the task outside the lock
     try:
         items = await task
     except HTTPException as e:
         # On upstream 429 or errors, try to serve stale if available
-        async with _cache_lock:
-            if key in _tweets_cache:
-                return _tweets_cache[key][1]
+        stale = _tweets_cache.get(key)
+        if stale is not None:
+            return stale[1]
         raise e
     finally:
         if not joiner:
-            async with _cache_lock:
-                _inflight_tasks.pop(key, None)
+            _inflight_tasks.pop(key, None)
 
     # Store in cache (creator only)
     if not joiner:
-        async with _cache_lock:
-            _tweets_cache[key] = (time.time(), items)
+        _cache_put(_tweets_cache, key, (time.time(), items), _TWEETS_CACHE_MAX)
+        _index_cache_key(query, key)
 
     return items
 
@@ -727,26 +1164,23 @@ async def _suggest_search_query(highlight_text: str) -> SearchHints | None:
     }
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
     try:
-        async with httpx.AsyncClient(timeout=12.0) as client:
-            resp = await client.post(url, json=payload, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-            content = (
-                data.get("choices", [{}])[0]
-                .get("message", {})
-                .get("content", "")
-            )
-            start = content.find("{")
-            end = content.rfind("}")
-            if start != -1 and end != -1 and end > start:
-                import json as _json
-                obj = _json.loads(content[start:end+1])
-                q = str(obj.get("query", "")).strip()
-                kws = [str(x).strip() for x in (obj.get("keywords") or []) if str(x).strip()]
-                tps = [str(x).strip() for x in (obj.get("topics") or []) if str(x).strip()]
-                if q:
-                    return SearchHints(query=q, keywords=kws[:12], topics=tps[:5])
-            return None
+        client = _get_http_client()
+        resp = await client.post(url, json=payload, headers=headers, timeout=12.0)
+        resp.raise_for_status()
+        data = resp.json()
+        content = (
+            data.get("choices", [{}])[0]
+            .get("message", {})
+            .get("content", "")
+        )
+        obj = _extract_first_json_object(content)
+        if obj is not None:
+            q = str(obj.get("query", "")).strip()
+            kws = [str(x).strip() for x in (obj.get("keywords") or []) if str(x).strip()]
+            tps = [str(x).strip() for x in (obj.get("topics") or []) if str(x).strip()]
+            if q:
+                return SearchHints(query=q, keywords=kws[:12], topics=tps[:5])
+        return None
     except Exception:
         return None
 
@@ -817,46 +1251,46 @@ async def _grok_rank_tweets(
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            resp = await client.post(url, json=payload, headers=headers)
-            resp.raise_for_status()
-            data = resp.json()
-            content = (
-                data.get("choices", [{}])[0]
-                .get("message", {})
-                .get("content", "")
-            )
+        client = _get_http_client()
+        resp = await client.post(url, json=payload, headers=headers, timeout=15.0)
+        resp.raise_for_status()
+        data = resp.json()
+        content = (
+            data.get("choices", [{}])[0]
+            .get("message", {})
+            .get("content", "")
+        )
 
-            # Parse the ranking array from response
-            start = content.find("[")
-            end = content.rfind("]")
-            if start != -1 and end != -1 and end > start:
-                ranking = json.loads(content[start:end + 1])
-                if isinstance(ranking, list):
-                    # Convert 1-indexed to 0-indexed and filter valid indices
-                    reranked = []
-                    seen = set()
-                    for idx in ranking:
-                        if isinstance(idx, int) and 1 <= idx <= len(tweets) and idx not in seen:
-                            reranked.append(tweets[idx - 1])
-                            seen.add(idx)
+        # Parse the ranking array from response
+        start = content.find("[")
+        end = content.rfind("]")
+        if start != -1 and end != -1 and end > start:
+            ranking = json.loads(content[start:end + 1])
+            if isinstance(ranking, list):
+                # Convert 1-indexed to 0-indexed and filter valid indices
+                reranked = []
+                seen = set()
+                for idx in ranking:
+                    if isinstance(idx, int) and 1 <= idx <= len(tweets) and idx not in seen:
+                        reranked.append(tweets[idx - 1])
+                        seen.add(idx)
+                        if len(reranked) >= max_results:
+                            break
+
+                # If Grok returned fewer than requested, append remaining by original order
+                if len(reranked) < max_results:
+                    for i, t in enumerate(tweets):
+                        if (i + 1) not in seen:
+                            reranked.append(t)
                             if len(reranked) >= max_results:
                                 break
 
-                    # If Grok returned fewer than requested, append remaining by original order
-                    if len(reranked) < max_results:
-                        for i, t in enumerate(tweets):
-                            if (i + 1) not in seen:
-                                reranked.append(t)
-                                if len(reranked) >= max_results:
-                                    break
-
-                    print(f"[grok_rank] Ranked {len(reranked)} tweets, order: {ranking[:max_results]}")
-                    return reranked
+                print(f"[grok_rank] Ranked {len(reranked)} tweets, order: {ranking[:max_results]}")
+                return reranked
 
-            # Parsing failed, return original order
-            print("[grok_rank] Failed to parse ranking, using original order")
-            return tweets[:max_results]
+        # Parsing failed, return original order
+        print("[grok_rank] Failed to parse ranking, using original order")
+        return tweets[:max_results]
 
     except Exception as e:
         print(f"[grok_rank] Error: {e}, using original order")
@@ -889,28 +1323,22 @@ async def search_tweets(q: str, max_results: int = 10, optimize: bool = True, no
         ordered = sorted(counts.items(), key=lambda kv: (kv[1], len(kv[0])), reverse=True)
         return [w for w, _ in ordered[:max_terms]]
 
-    hints: SearchHints | None = None
-    if optimize:
-        hints = await _suggest_search_query(phrase)
-    if hints and hints.query:
-        query = hints.query
-    else:
+    def _build_fallback_query() -> str:
         # Check if the input already looks like a pre-built OR query (from frontend rawMode)
         # Pattern: starts with ( and contains OR
         is_prebuilt_query = phrase.startswith("(") and " OR " in phrase.upper()
         if is_prebuilt_query:
             # Use the query as-is - it's already formatted by the frontend
-            query = phrase
-        else:
-            terms = _extract_terms(phrase)
-            if not terms:
-                parts = [p for p in re.sub(r"\s+", " ", phrase).split(" ") if len(p) >= 3]
-                terms = parts[:8]
-            # Limit to 6 most important terms to avoid overly complex queries
-            terms = terms[:6]
-            pieces = [f'"{t}"' if (" " in t) else t for t in terms]
-            or_block = " OR ".join(pieces) if pieces else phrase
-            query = f"({or_block})"
+            return phrase
+        terms = _extract_terms(phrase)
+        if not terms:
+            parts = [p for p in re.sub(r"\s+", " ", phrase).split(" ") if len(p) >= 3]
+            terms = parts[:8]
+        # Limit to 6 most important terms to avoid overly complex queries
+        terms = terms[:6]
+        pieces = [f'"{t}"' if (" " in t) else t for t in terms]
+        or_block = " OR ".join(pieces) if pieces else phrase
+        return f"({or_block})"
 
     # Sanitize query for X API: remove or space out disallowed characters like '/'
     def _sanitize_x_query(s: str) -> str:
@@ -919,7 +1347,31 @@ async def search_tweets(q: str, max_results: int = 10, optimize: bool = True, no
         s = re.sub(r"\s+", " ", s).strip()
         return s
 
-    query = _sanitize_x_query(query)
+    # We will fetch a larger candidate pool (3x) to re-rank by keyword coverage + engagement
+    fetch_count = max_results * 3
+    fallback_query = _sanitize_x_query(_build_fallback_query())
+
+    # Run the Grok hints call and a speculative X fetch (with the keyword fallback
+    # query) in parallel; the prefetch is cancelled if hints produce a different
+    # query, otherwise one full LLM round-trip is shaved off the critical path.
+    hints: SearchHints | None = None
+    prefetch_task: asyncio.Task | None = None
+    if optimize:
+        hints_task = asyncio.create_task(_suggest_search_query(phrase))
+        if await _reserve_rate_slot():
+            prefetch_task = asyncio.create_task(
+                _fetch_recent_top_tweets(query=fallback_query, return_count=fetch_count, pool_size=100)
+            )
+        hints = await hints_task
+
+    if hints and hints.query:
+        query = _sanitize_x_query(hints.query)
+    else:
+        query = fallback_query
+
+    if prefetch_task is not None and query != fallback_query:
+        prefetch_task.cancel()
+        prefetch_task = None
 
     # Debug: log the final query being used
     print(f"[search_tweets] optimize={optimize}, is_prebuilt={phrase.startswith('(') and ' OR ' in phrase.upper()}, final_query={query}")
@@ -927,56 +1379,59 @@ async def search_tweets(q: str, max_results: int = 10, optimize: bool = True, no
     key = f"q={query}|n={max_results}"
     now = time.time()
 
-    # We will fetch a larger candidate pool (3x) to re-rank by keyword coverage + engagement
-    fetch_count = max_results * 3
-
-    async with _cache_lock:
-        if not nocache:
-            if key in _tweets_cache:
-                ts, items = _tweets_cache[key]
-                if now - ts < CACHE_TTL_SECONDS:
-                    return SearchResponse(tweets=items, hints=hints)
-                else:
-                    _tweets_cache.pop(key, None)
-
-            if key in _inflight_tasks:
-                task = _inflight_tasks[key]
-                joiner = True
-            else:
-                async with _rate_lock:
-                    while _rate_calls and (now - _rate_calls[0] > RATE_LIMIT_WINDOW_SECONDS):
-                        _rate_calls.popleft()
-                    if len(_rate_calls) >= RATE_LIMIT_MAX_REQUESTS:
-                        if key in _tweets_cache:
-                            return SearchResponse(tweets=_tweets_cache[key][1], hints=hints)
-                        raise HTTPException(status_code=429, detail="Rate limit exceeded for tweets endpoint. Please try again later.")
-                    _rate_calls.append(now)
+    if not nocache:
+        entry = _tweets_cache.get(key)
+        if entry is not None:
+            ts, items = entry
+            if now - ts < CACHE_TTL_SECONDS:
+                _tweets_cache.move_to_end(key)
+                if prefetch_task is not None:
+                    prefetch_task.cancel()
+                return SearchResponse(tweets=items, hints=hints)
+            _tweets_cache.pop(key, None)
+
+        task = _inflight_tasks.get(key)
+        if task is not None:
+            if prefetch_task is not None:
+                prefetch_task.cancel()
+            joiner = True
+        elif prefetch_task is not None:
+            # Adopt the speculative fetch (its rate slot is already reserved)
+            task = prefetch_task
+            _inflight_tasks[key] = task
+            joiner = False
+        else:
+            if not await _reserve_rate_slot():
+                if entry is not None:
+                    return SearchResponse(tweets=entry[1], hints=hints)
+                raise HTTPException(status_code=429, detail="Rate limit exceeded for tweets endpoint. Please try again later.")
+            # Re-check: the rate-slot await may have let another request register
+            task = _inflight_tasks.get(key)
+            joiner = task is not None
+            if not joiner:
                 task = asyncio.create_task(_fetch_recent_top_tweets(query=query, return_count=fetch_count, pool_size=100))
                 _inflight_tasks[key] = task
-                joiner = False
+    else:
+        # nocache: always create a fresh task, don't join inflight
+        if prefetch_task is not None:
+            task = prefetch_task
         else:
-            # nocache: always create a fresh task, don't join inflight
-            async with _rate_lock:
-                while _rate_calls and (now - _rate_calls[0] > RATE_LIMIT_WINDOW_SECONDS):
-                    _rate_calls.popleft()
-                if len(_rate_calls) >= RATE_LIMIT_MAX_REQUESTS:
-                    raise HTTPException(status_code=429, detail="Rate limit exceeded for tweets endpoint. Please try again later.")
-                _rate_calls.append(now)
+            if not await _reserve_rate_slot():
+                raise HTTPException(status_code=429, detail="Rate limit exceeded for tweets endpoint. Please try again later.")
             task = asyncio.create_task(_fetch_recent_top_tweets(query=query, return_count=fetch_count, pool_size=100))
-            joiner = False
+        joiner = False
 
     try:
         items = await task
     except HTTPException as e:
         if not nocache:
-            async with _cache_lock:
-                if key in _tweets_cache:
-                    return SearchResponse(tweets=_tweets_cache[key][1], hints=hints)
+            stale = _tweets_cache.get(key)
+            if stale is not None:
+                return SearchResponse(tweets=stale[1], hints=hints)
         raise e
     finally:
         if not joiner:
-            async with _cache_lock:
-                _inflight_tasks.pop(key, None)
+            _inflight_tasks.pop(key, None)
 
     # Use Grok to rank tweets by semantic relevance to highlighted text
     # Gather keywords from hints or extract from query
@@ -993,17 +1448,39 @@ async def search_tweets(q: str, max_results: int = 10, optimize: bool = True, no
             return [t for t in qs.split(" ") if t and len(t) > 2]
         ranking_keywords = _extract_rank_terms(query)
 
-    # Use Grok for intelligent ranking based on semantic relevance
-    reranked = await _grok_rank_tweets(
-        tweets=items,
-        highlighted_text=phrase,
-        keywords=ranking_keywords,
-        max_results=max_results
-    )
+    # Cheap lexical prefilter: keyword coverage picks the strongest candidates so the
+    # Grok reranker only sees a small pool instead of the full 3x fetch. The pool
+    # never shrinks below what the caller asked for.
+    kws = [k.lower() for k in ranking_keywords]
+
+    def _coverage(t: TweetItem) -> int:
+        text = t.text.lower()
+        return sum(1 for kw in kws if kw in text)
+
+    pool = max(GROK_RERANK_POOL, max_results)
+    candidates = items
+    if kws and len(items) > pool:
+        candidates = heapq.nlargest(pool, items, key=_coverage)
+
+    top_two = heapq.nlargest(2, (_coverage(t) for t in candidates)) if kws else []
+    if len(candidates) <= 1:
+        reranked = candidates
+    elif len(top_two) == 2 and top_two[0] >= len(kws) and top_two[0] - top_two[1] >= 2:
+        # Early exit: the best candidate covers every keyword and clearly
+        # dominates the runner-up, so the LLM round-trip can't change the top
+        reranked = sorted(candidates, key=_coverage, reverse=True)[:max_results]
+    else:
+        # Use Grok for intelligent ranking based on semantic relevance
+        reranked = await _grok_rank_tweets(
+            tweets=candidates,
+            highlighted_text=phrase,
+            keywords=ranking_keywords,
+            max_results=max_results
+        )
 
     if not joiner:
-        async with _cache_lock:
-            _tweets_cache[key] = (time.time(), reranked)
+        _cache_put(_tweets_cache, key, (time.time(), reranked), _TWEETS_CACHE_MAX)
+        _index_cache_key(query, key)
 
     return SearchResponse(tweets=reranked, hints=hints)
 
@@ -1015,15 +1492,10 @@ async def refresh_topic_tweets(topic_slug: str) -> Response:
     if not phrase:
         raise HTTPException(status_code=400, detail="Empty topic slug")
     query = f'"{phrase}"'
-    key_prefix = f"q={query}|"
-    async with _cache_lock:
-        to_delete = [k for k in list(_tweets_cache.keys()) if k.startswith(key_prefix)]
-        for k in to_delete:
-            _tweets_cache.pop(k, None)
-        # also clear summary cache for this topic
-        to_delete_s = [k for k in list(_summary_cache.keys()) if k.startswith(key_prefix)]
-        for k in to_delete_s:
-            _summary_cache.pop(k, None)
+    # Drop tweets + summary entries via the query index instead of scanning all keys
+    for k in _query_index.pop(query, ()):
+        _tweets_cache.pop(k, None)
+        _summary_cache.pop(k, None)
     return Response(status_code=204)
 
 
@@ -1039,17 +1511,16 @@ async def get_topic_tweets_summary(topic_slug: str, max_results: int = 10) -> Tw
     now = time.time()
 
     # Try cache first
-    async with _cache_lock:
-        if key in _summary_cache:
-            ts, bullets = _summary_cache[key]
-            if now - ts < SUMMARY_TTL_SECONDS:
-                return TweetsSummary(bullets=bullets, model=_get_grok_model(), cached=True)
-            else:
-                _summary_cache.pop(key, None)
+    entry = _summary_cache.get(key)
+    if entry is not None:
+        ts, bullets = entry
+        if now - ts < SUMMARY_TTL_SECONDS:
+            _summary_cache.move_to_end(key)
+            return TweetsSummary(bullets=bullets, model=_get_grok_model(), cached=True)
+        _summary_cache.pop(key, None)
 
     # We need tweets first (use existing cache if warm)
-    async with _cache_lock:
-        cached = _tweets_cache.get(key)
+    cached = _tweets_cache.get(key)
     if cached:
         tweets = cached[1]
     else:
@@ -1058,8 +1529,8 @@ async def get_topic_tweets_summary(topic_slug: str, max_results: int = 10) -> Tw
     bullets = await _generate_tweets_summary(phrase, tweets)
 
     # Store in cache
-    async with _cache_lock:
-        _summary_cache[key] = (time.time(), bullets)
+    _cache_put(_summary_cache, key, (time.time(), bullets), _SUMMARY_CACHE_MAX)
+    _index_cache_key(query, key)
 
     return TweetsSummary(bullets=bullets, model=_get_grok_model(), cached=False)
 
@@ -1067,21 +1538,20 @@ async def get_topic_tweets_summary(topic_slug: str, max_results: int = 10) -> Tw
 # --- Dynamic Topic Endpoint (catch-all, must come LAST) ---
 
 @app.get("/api/topics/{topic_slug:path}")
-def get_topic(topic_slug: str) -> TopicDetail:
+async def get_topic(topic_slug: str) -> TopicDetail:
     """Get a specific topic by slug."""
-    data = load_data()
     decoded_slug = unquote(topic_slug)
+    a = get_article_by_slug(decoded_slug)
+    if a is None:
+        raise HTTPException(status_code=404, detail="Topic not found")
 
-    for a in data:
-        if extract_slug(a['url']) == decoded_slug:
-            return TopicDetail(
-                suggestion_count=get_suggestion_count(decoded_slug),
-                topic=extract_slug(a['url']),
-                title=a['title'],
-                content=a['content'],
-                id=extract_slug(a['url'])  # Use slug as ID
-            )
-    raise HTTPException(status_code=404, detail="Topic not found")
+    return TopicDetail(
+        suggestion_count=get_suggestion_count(decoded_slug),
+        topic=decoded_slug,
+        title=a['title'],
+        content=a['content'],
+        id=decoded_slug  # Use slug as ID
+    )
 
 
 # ---- Community Feed Helper Functions ----
@@ -1103,25 +1573,39 @@ def _get_grok_model() -> str:
     return os.getenv("GROK_MODEL", "grok-2-latest")
 
 
+_X_WEB_STATUS = "https://x.com/i/web/status/"
+
+# Follower normalizers memoized per 100-follower bucket: float pow is the
+# priciest op in _compute_score and follower counts repeat heavily per pool
+_followers_pow_cache: dict[int, float] = {}
+_VERIFIED_MULT = max(1.0, VERIFIED_BOOST)
+
+
 def _compute_score(tweet: dict, user: dict) -> float:
     metrics = tweet.get("public_metrics", {}) or {}
-    likes = float(metrics.get("like_count", 0) or 0)
-    rts = float(metrics.get("retweet_count", 0) or 0)
-    replies = float(metrics.get("reply_count", 0) or 0)
-    quotes = float(metrics.get("quote_count", 0) or 0)
+    # Counts stay as ints (the API can send null, hence the `or 0`); the
+    # weighted sum below promotes to float once
+    likes = metrics.get("like_count", 0) or 0
+    rts = metrics.get("retweet_count", 0) or 0
+    replies = metrics.get("reply_count", 0) or 0
+    quotes = metrics.get("quote_count", 0) or 0
     # Author followers for normalization
     um = (user or {}).get("public_metrics", {}) or {}
-    followers = float(um.get("followers_count", 0) or 0)
+    followers = um.get("followers_count", 0) or 0
     # Engagement score emphasizing RTs and quotes, then normalize by audience size
     raw = likes + 2.0 * rts + 1.5 * quotes + 0.5 * replies
-    norm = (max(50.0, followers) ** 0.7)  # dampen large accounts
-    score = raw / norm if norm > 0 else raw
+    bucket = int(followers) // 100
+    norm = _followers_pow_cache.get(bucket)
+    if norm is None:
+        if len(_followers_pow_cache) > 4096:
+            _followers_pow_cache.clear()
+        # dampen large accounts; bucket floor keeps the memoized value deterministic
+        norm = max(50.0, float(bucket * 100)) ** 0.7
+        _followers_pow_cache[bucket] = norm
+    score = raw / norm
     # Apply a modest boost for verified accounts
-    try:
-        if user.get("verified"):
-            score *= max(1.0, VERIFIED_BOOST)
-    except Exception:
-        pass
+    if user and user.get("verified"):
+        score *= _VERIFIED_MULT
     return score
 
 
@@ -1144,102 +1628,109 @@ async def _fetch_recent_top_tweets(query: str, return_count: int = 10, pool_size
     }
     headers = {"Authorization": f"Bearer {token}"}
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        # First, attempt Full-Archive Search
-        use_recent_fallback = False
+    client = _get_http_client()
+    # First, attempt Full-Archive Search
+    use_recent_fallback = False
+    try:
+        r = await client.get(all_url, params=params, headers=headers, timeout=10.0)
+        if r.status_code == 404:
+            # Fallback domain
+            r = await client.get("https://api.twitter.com/2/tweets/search/all", params=params, headers=headers, timeout=10.0)
+        if r.status_code in (401, 403):
+            use_recent_fallback = True
+        else:
+            r.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        if e.response is not None and e.response.status_code in (401, 403, 404):
+            use_recent_fallback = True
+        else:
+            raise HTTPException(status_code=e.response.status_code if e.response else 502, detail=(e.response.text if e.response else str(e)))
+    except httpx.RequestError as e:
+        # Network problem on archive; try recent
+        use_recent_fallback = True
+
+    data = None
+    if use_recent_fallback:
         try:
-            r = await client.get(all_url, params=params, headers=headers)
-            if r.status_code == 404:
-                # Fallback domain
-                r = await client.get("https://api.twitter.com/2/tweets/search/all", params=params, headers=headers)
-            if r.status_code in (401, 403):
-                use_recent_fallback = True
-            else:
-                r.raise_for_status()
+            r2 = await client.get(recent_url, params=params, headers=headers, timeout=10.0)
+            if r2.status_code == 404:
+                r2 = await client.get("https://api.twitter.com/2/tweets/search/recent", params=params, headers=headers, timeout=10.0)
+            r2.raise_for_status()
+            data = r2.json()
         except httpx.HTTPStatusError as e:
-            if e.response is not None and e.response.status_code in (401, 403, 404):
-                use_recent_fallback = True
-            else:
-                raise HTTPException(status_code=e.response.status_code if e.response else 502, detail=(e.response.text if e.response else str(e)))
+            raise HTTPException(status_code=e.response.status_code, detail=e.response.text)
         except httpx.RequestError as e:
-            # Network problem on archive; try recent
-            use_recent_fallback = True
+            raise HTTPException(status_code=502, detail=f"Failed to reach X API: {e}")
+    else:
+        data = r.json()
+
+    tweets = data.get("data", []) or []
+    includes = data.get("includes", {}) or {}
+    users = {u.get("id"): u for u in includes.get("users", [])}
+
+    ranked: list[tuple[float, dict, dict]] = []
+    for t in tweets:
+        u = users.get(t.get("author_id")) if t.get("author_id") else None
+        score = _compute_score(t, u or {})
+        ranked.append((score, t, u or {}))
 
-        data = None
-        if use_recent_fallback:
+    if not ranked:
+        return []
+
+    # Partial selection: only the top slice is needed, not a fully sorted pool
+    ranked = heapq.nlargest(max(1, return_count * 2), ranked, key=lambda x: x[0])
+    out: list[TweetItem] = []
+    cutoff_dt = datetime.now(timezone.utc) - timedelta(hours=TRENDING_HOURS)
+    for idx, (score, t, u) in enumerate(ranked[:return_count]):
+        tid = t.get("id")
+        text = t.get("text", "")
+        created_at = t.get("created_at")
+        metrics = t.get("public_metrics", {}) or {}
+        # u is always a dict here: the ranking pass stores `u or {}`
+        username = u.get("username")
+        name = u.get("name")
+        pfp = u.get("profile_image_url")
+        verified = u.get("verified")
+        verified_type = u.get("verified_type")
+        url = f"https://x.com/{username}/status/{tid}" if username and tid else _X_WEB_STATUS + str(tid)
+        # trending flag: recent within TRENDING_HOURS and ranked within top-K
+        is_recent = False
+        if created_at:
             try:
-                r2 = await client.get(recent_url, params=params, headers=headers)
-                if r2.status_code == 404:
-                    r2 = await client.get("https://api.twitter.com/2/tweets/search/recent", params=params, headers=headers)
-                r2.raise_for_status()
-                data = r2.json()
-            except httpx.HTTPStatusError as e:
-                raise HTTPException(status_code=e.response.status_code, detail=e.response.text)
-            except httpx.RequestError as e:
-                raise HTTPException(status_code=502, detail=f"Failed to reach X API: {e}")
-        else:
-            data = r.json()
-
-        tweets = data.get("data", []) or []
-        includes = data.get("includes", {}) or {}
-        users = {u.get("id"): u for u in includes.get("users", [])}
-
-        ranked: list[tuple[float, dict, dict]] = []
-        for t in tweets:
-            u = users.get(t.get("author_id")) if t.get("author_id") else None
-            score = _compute_score(t, u or {})
-            ranked.append((score, t, u or {}))
-
-        if not ranked:
-            return []
-
-        ranked.sort(key=lambda x: x[0], reverse=True)
-        ranked = ranked[:max(1, return_count * 2)]
-        out: list[TweetItem] = []
-        now_dt = datetime.now(timezone.utc)
-        for idx, (score, t, u) in enumerate(ranked[:return_count]):
-            tid = t.get("id")
-            text = t.get("text", "")
-            created_at = t.get("created_at")
-            metrics = t.get("public_metrics", {}) or {}
-            username = (u or {}).get("username")
-            name = (u or {}).get("name")
-            pfp = (u or {}).get("profile_image_url")
-            verified = (u or {}).get("verified")
-            verified_type = (u or {}).get("verified_type")
-            url = f"https://x.com/{username}/status/{tid}" if username and tid else f"https://x.com/i/web/status/{tid}"
-            # trending flag: recent within TRENDING_HOURS and ranked within top-K
-            is_recent = False
-            if created_at:
+                # Py3.11+ parses a trailing "Z" natively; fall back for older interpreters
                 try:
+                    dt = datetime.fromisoformat(created_at)
+                except ValueError:
                     dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    is_recent = (now_dt - dt) <= timedelta(hours=TRENDING_HOURS)
-                except Exception:
-                    is_recent = False
-            # Trending preview override (rank-based, regardless of recency)
-            rank1 = idx + 1
-            preview_trend = (TRENDING_PREVIEW_TOP_K > 0 and idx < TRENDING_PREVIEW_TOP_K) or (rank1 in TRENDING_PREVIEW_RANKS)
-            is_trending = bool(preview_trend or (is_recent and (idx < max(1, TRENDING_TOP_K))))
-            out.append(
-                TweetItem(
-                    id=tid,
-                    text=text,
-                    author_username=username or "",
-                    author_name=name,
-                    author_profile_image_url=pfp,
-                    author_verified=bool(verified) if verified is not None else None,
-                    author_verified_type=verified_type,
-                    created_at=created_at,
-                    like_count=metrics.get("like_count"),
-                    retweet_count=metrics.get("retweet_count"),
-                    reply_count=metrics.get("reply_count"),
-                    quote_count=metrics.get("quote_count"),
-                    url=url,
-                    score=score,
-                    trending=is_trending,
-                )
+                is_recent = dt >= cutoff_dt
+            except Exception:
+                is_recent = False
+        # Trending preview override (rank-based, regardless of recency)
+        rank1 = idx + 1
+        preview_trend = (TRENDING_PREVIEW_TOP_K > 0 and idx < TRENDING_PREVIEW_TOP_K) or (rank1 in TRENDING_PREVIEW_RANKS)
+        is_trending = bool(preview_trend or (is_recent and idx < _TRENDING_TOP_K_EFF))
+        # model_construct skips validation; every field here is already the
+        # declared type (our own parsing of the X API payload)
+        out.append(
+            TweetItem.model_construct(
+                id=tid,
+                text=text,
+                author_username=username or "",
+                author_name=name,
+                author_profile_image_url=pfp,
+                author_verified=bool(verified) if verified is not None else None,
+                author_verified_type=verified_type,
+                created_at=created_at,
+                like_count=metrics.get("like_count"),
+                retweet_count=metrics.get("retweet_count"),
+                reply_count=metrics.get("reply_count"),
+                quote_count=metrics.get("quote_count"),
+                url=url,
+                score=score,
+                trending=is_trending,
             )
-        return out
+        )
+    return out
 
 
 async def _generate_tweets_summary(topic_phrase: str, tweets: List[TweetItem]) -> List[str]:
@@ -1279,6 +1770,7 @@ async def _generate_tweets_summary(topic_phrase: str, tweets: List[TweetItem]) -
         # Encourage json-like behavior; different Grok deployments may ignore, that's fine
         "temperature": 0.2,
         "max_tokens": 256,
+        "stream": True,
     }
 
     headers = {
@@ -1286,28 +1778,46 @@ async def _generate_tweets_summary(topic_phrase: str, tweets: List[TweetItem]) -
         "Content-Type": "application/json",
     }
 
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        try:
-            resp = await client.post(url, json=payload, headers=headers)
-            resp.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            raise HTTPException(status_code=e.response.status_code, detail=e.response.text)
-        except httpx.RequestError as e:
-            raise HTTPException(status_code=502, detail=f"Failed to reach Grok API: {e}")
-
-    data = resp.json()
-
-    # Try to parse content as a JSON array
-    content = None
+    client = _get_http_client()
+    # Stream the completion so parsing overlaps generation, and stop reading as
+    # soon as the JSON array closes instead of waiting for the final token
+    pieces: list[str] = []
     try:
-        # OpenAI-style response structure compatibility
-        content = (
-            data.get("choices", [{}])[0]
-            .get("message", {})
-            .get("content", "")
-        )
-    except Exception:
-        content = None
+        async with client.stream("POST", url, json=payload, headers=headers, timeout=15.0) as resp:
+            if resp.status_code >= 400:
+                detail = (await resp.aread()).decode("utf-8", "replace")
+                raise HTTPException(status_code=resp.status_code, detail=detail)
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                chunk = line[6:]
+                if chunk == "[DONE]":
+                    break
+                try:
+                    delta = orjson.loads(chunk)["choices"][0].get("delta", {}).get("content") or ""
+                except (orjson.JSONDecodeError, LookupError):
+                    continue
+                if not delta:
+                    continue
+                pieces.append(delta)
+                # Cheap completeness check: only attempt a parse when the tail
+                # looks like it just closed the top-level array. Counting
+                # brackets would miscount ones inside bullet strings.
+                if delta.rstrip().endswith("]"):
+                    text = "".join(pieces)
+                    start = text.find("[")
+                    if start == -1:
+                        continue
+                    try:
+                        parsed = orjson.loads(text[start:])
+                    except orjson.JSONDecodeError:
+                        continue
+                    if isinstance(parsed, list):
+                        break
+    except httpx.RequestError as e:
+        raise HTTPException(status_code=502, detail=f"Failed to reach Grok API: {e}")
+
+    content = "".join(pieces)
 
     bullets: List[str] = []
     if isinstance(content, str):
@@ -1317,8 +1827,7 @@ async def _generate_tweets_summary(topic_phrase: str, tweets: List[TweetItem]) -
             start = content.find("[")
             end = content.rfind("]")
             if start != -1 and end != -1 and end > start:
-                import json as _json
-                arr = _json.loads(content[start: end + 1])
+                arr = orjson.loads(content[start: end + 1])
                 if isinstance(arr, list):
                     bullets = [str(x) for x in arr][:3]
         except Exception:
@@ -1327,49 +1836,44 @@ async def _generate_tweets_summary(topic_phrase: str, tweets: List[TweetItem]) -
     # Ensure we return up to 3 compact bullets
     bullets = [b.strip() for b in bullets if isinstance(b, str) and b.strip()][:3]
     return bullets
+
+
+# Sorted thresholds + label arrays: one bisect instead of an if-elif ladder.
+_FACTUAL_THRESHOLDS = (1.0, 2.5, 4.0, 6.0, 8.0)
+_FACTUAL_LABELS = ("Very High", "High", "Mostly Factual", "Mixed", "Low", "Very Low")
+# Bias uses <= for the left side and < for the right, so the boundary handling differs:
+# bisect_left keeps scores equal to a left threshold in the lower bucket, while
+# bisect_right pushes scores equal to a right threshold into the higher bucket.
+_BIAS_THRESHOLDS = (-7.5, -3.5, -1.0, 1.0, 3.5, 7.5)
+_BIAS_LABELS = ("Extreme Left", "Left", "Left-Center", "Center", "Right-Center", "Right", "Extreme Right")
+
+
 def get_factual_label(score: float) -> str:
     """Map factual reporting score (0-10, lower is better) to label."""
-    if score <= 1.0:
-        return "Very High"
-    elif score <= 2.5:
-        return "High"
-    elif score <= 4.0:
-        return "Mostly Factual"
-    elif score <= 6.0:
-        return "Mixed"
-    elif score <= 8.0:
-        return "Low"
-    else:
-        return "Very Low"
+    return _FACTUAL_LABELS[bisect.bisect_left(_FACTUAL_THRESHOLDS, score)]
 
 
 def get_bias_label(score: float) -> str:
     """Map bias score (-10 to +10) to label. Negative = Left, Positive = Right, Near 0 = Center."""
-    if score <= -7.5:
-        return "Extreme Left"
-    elif score <= -3.5:
-        return "Left"
-    elif score <= -1.0:
-        return "Left-Center"
-    elif score < 1.0:
-        return "Center"
-    elif score < 3.5:
-        return "Right-Center"
-    elif score < 7.5:
-        return "Right"
-    else:
-        return "Extreme Right"
+    if score < 1.0:
+        return _BIAS_LABELS[bisect.bisect_left(_BIAS_THRESHOLDS, score)]
+    return _BIAS_LABELS[bisect.bisect_right(_BIAS_THRESHOLDS, score)]
+
+
+# Markdown links: [optional text](url), compiled once
+_MD_LINK_URL_RE = re.compile(r'\[(?:[^\]]*)\]\(([^)]+)\)')
 
 
 def extract_citations_from_content(content: str) -> list[str]:
     """Extract all URLs from markdown content (both [text](url) and [](url) formats)."""
-    # Match markdown links: [optional text](url)
-    pattern = r'\[(?:[^\]]*)\]\(([^)]+)\)'
-    urls = re.findall(pattern, content)
-    # Filter to only http/https URLs and deduplicate while preserving order
-    seen = set()
-    result = []
-    for url in urls:
+    # Fast path: without "](" there can be no markdown link, skip the regex scan
+    if '](' not in content:
+        return []
+    # Stream matches, keeping only deduplicated http/https URLs in order
+    seen: set[str] = set()
+    result: list[str] = []
+    for m in _MD_LINK_URL_RE.finditer(content):
+        url = m.group(1)
         if url.startswith(('http://', 'https://')) and url not in seen:
             seen.add(url)
             result.append(url)
@@ -1377,23 +1881,16 @@ def extract_citations_from_content(content: str) -> list[str]:
 
 
 @app.get("/api/aggregate_bias/{topic_slug:path}")
-def aggregate_bias(topic_slug: str, version_index: int | None = None) -> AggregateBiasResponse:
+async def aggregate_bias(topic_slug: str, version_index: int | None = None) -> AggregateBiasResponse:
     """Get aggregated bias and factual reporting data for an article's citations.
 
     Args:
         topic_slug: The article slug
         version_index: Optional version index. If provided, extracts citations from that version's content.
     """
-    # Load articles
-    data = load_data()
-    decoded_slug = unquote(topic_slug)
-
     # Find the article
-    article = None
-    for a in data:
-        if extract_slug(a['url']) == decoded_slug:
-            article = a
-            break
+    decoded_slug = unquote(topic_slug)
+    article = get_article_by_slug(decoded_slug)
 
     if not article:
         raise HTTPException(status_code=404, detail="Topic not found")
@@ -1422,43 +1919,35 @@ def aggregate_bias(topic_slug: str, version_index: int | None = None) -> Aggrega
             detail="Article has no citations"
         )
     
-    # Load citation evaluations (now a dict with URLs as keys)
-    try:
-        with open(CITATION_EVALUATIONS_FILE, 'r', encoding='utf-8') as f:
-            evaluations = json.load(f)
-    except FileNotFoundError:
-        raise HTTPException(
-            status_code=500,
-            detail="Citation evaluations file not found"
-        )
-    
-    # Match citations to evaluations and collect scores
-    factual_scores = []
-    bias_scores = []
-    
+    # Flattened rows avoid walking the nested evaluation dicts per citation
+    eval_rows = load_citation_evaluations()["rows"]
+
+    # Match citations to evaluations, keeping running sums instead of score lists
+    factual_sum = 0.0
+    factual_n = 0
+    bias_sum = 0.0
+    bias_n = 0
+
     for citation_url in citations:
-        if citation_url in evaluations:
-            eval_entry = evaluations[citation_url]
-            eval_data = eval_entry.get('evaluation', {})
-            article_eval = eval_data.get('article', {})
-            
-            factual = article_eval.get('factual_reporting', {})
-            bias_data = article_eval.get('bias', {})
-            
-            if 'overall_score' in factual:
-                factual_scores.append(factual['overall_score'])
-            if 'overall_score' in bias_data:
-                bias_scores.append(bias_data['overall_score'])
-    
-    if not factual_scores and not bias_scores:
+        row = eval_rows.get(citation_url)
+        if row is None:
+            continue
+        if row.factual_score is not None:
+            factual_sum += row.factual_score
+            factual_n += 1
+        if row.bias_score is not None:
+            bias_sum += row.bias_score
+            bias_n += 1
+
+    if not factual_n and not bias_n:
         raise HTTPException(
             status_code=404,
             detail="No evaluated citations found for this article"
         )
-    
+
     # Calculate averages
-    avg_factual = sum(factual_scores) / len(factual_scores) if factual_scores else 0.0
-    avg_bias = sum(bias_scores) / len(bias_scores) if bias_scores else 0.0
+    avg_factual = factual_sum / factual_n if factual_n else 0.0
+    avg_bias = bias_sum / bias_n if bias_n else 0.0
     
     # Get labels
     factual_label = get_factual_label(avg_factual)
@@ -1468,7 +1957,7 @@ def aggregate_bias(topic_slug: str, version_index: int | None = None) -> Aggrega
         article_title=article_title,
         article_url=article_url,
         citation_count=len(citations),
-        evaluated_citation_count=len(factual_scores),
+        evaluated_citation_count=factual_n,
         average_factual_score=round(avg_factual, 1),
         factual_label=factual_label,
         average_bias_score=round(avg_bias, 1),
@@ -1508,12 +1997,12 @@ async def fetch_article(url: str) -> ArticlePreview:
 
     try:
         # Fetch the page
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
+        client = _get_http_client()
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        }
+        response = await client.get(url, headers=headers, timeout=15.0, follow_redirects=True)
+        response.raise_for_status()
 
         # Parse HTML
         soup = BeautifulSoup(response.text, "html.parser")
@@ -1593,77 +2082,76 @@ async def fetch_article(url: str) -> ArticlePreview:
         )
 
 
-@app.get("/api/citation_bias")
-def get_citation_bias(url: str) -> CitationBiasResponse:
+@app.get("/api/citation_bias", response_model=CitationBiasResponse)
+async def get_citation_bias(url: str, request: Request) -> Response:
     """Get bias and factual reporting data for a specific citation URL."""
-    from urllib.parse import unquote
-    
     # Load citation evaluations
-    try:
-        with open(CITATION_EVALUATIONS_FILE, 'r', encoding='utf-8') as f:
-            evaluations = json.load(f)
-    except FileNotFoundError:
-        raise HTTPException(
-            status_code=500,
-            detail="Citation evaluations file not found"
-        )
-    
+    index = load_citation_evaluations()
+    evaluations = index["evaluations"]
+    normalized_index = index["normalized"]
+    sorted_norm_keys = index["sorted_keys"]
+
     # Normalize URL: decode URL encoding and try to match
     # First try exact match
-    normalized_url = unquote(url).rstrip('/')
-    original_url = url.rstrip('/')
-    
+    decoded_url = unquote(url)
+
     # Try multiple variations
     url_variants = [
         url,
-        normalized_url,
-        original_url,
+        decoded_url,
         url.rstrip('/'),
-        normalized_url.rstrip('/'),
+        decoded_url.rstrip('/'),
     ]
-    
+
     eval_entry = None
     matched_url = None
-    
+
     for variant in url_variants:
         if variant in evaluations:
             eval_entry = evaluations[variant]
             matched_url = variant
             break
-    
+
     if not eval_entry:
-        # Try case-insensitive and with/without trailing slash
-        url_lower = url.lower()
-        for key in evaluations.keys():
-            if key.lower() == url_lower or key.lower().rstrip('/') == url_lower.rstrip('/'):
-                eval_entry = evaluations[key]
-                matched_url = key
-                break
-    
+        # Case-insensitive / trailing-slash match via the precomputed index
+        needle = _norm_url(decoded_url)
+        matched_url = (
+            normalized_index.get(_norm_url(url))
+            or normalized_index.get(needle)
+        )
+        if matched_url is None:
+            # O(log N) prefix match over sorted keys catches tracking-suffix variants
+            i = bisect.bisect_left(sorted_norm_keys, needle)
+            for j in (i, i - 1):
+                if 0 <= j < len(sorted_norm_keys):
+                    candidate = sorted_norm_keys[j]
+                    if candidate.startswith(needle) or needle.startswith(candidate):
+                        matched_url = normalized_index[candidate]
+                        break
+        if matched_url:
+            eval_entry = evaluations[matched_url]
+
     if not eval_entry:
         raise HTTPException(
             status_code=404,
             detail=f"Citation not found or not evaluated. Tried: {url}"
         )
-    
-    eval_data = eval_entry.get('evaluation', {})
-    article_eval = eval_data.get('article', {})
-    
-    factual = article_eval.get('factual_reporting', {})
-    bias_data = article_eval.get('bias', {})
-    
-    factual_score = factual.get('overall_score', 0.0)
-    bias_score = bias_data.get('overall_score', 0.0)
-    
-    factual_label = get_factual_label(factual_score)
-    bias_label = get_bias_label(bias_score)
-    
-    return CitationBiasResponse(
-        citation_url=matched_url or url,
-        factual_score=round(factual_score, 1),
-        factual_label=factual_label,
-        bias_score=round(bias_score, 1),
-        bias_label=bias_label
+
+    # Responses only change when the evaluations file does, so a matching ETag
+    # lets the client skip the body (and us the serialization) entirely.
+    etag = f'W/"{index["version"]}-{hashlib.sha256(matched_url.encode()).hexdigest()[:12]}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
+    # Serve the response bytes pre-built at evaluations load time: no per-request
+    # score extraction, label mapping, or Pydantic serialization.
+    return Response(
+        content=index["bias_blobs"][matched_url],
+        media_type="application/json",
+        headers={
+            "ETag": etag,
+            "Cache-Control": "max-age=60, stale-while-revalidate=300",
+        },
     )
 
 
@@ -1679,10 +2167,65 @@ class SummaryResponse(BaseModel):
     error: str | None = None
 
 
-@app.post("/api/summarize-preview")
-async def summarize_preview(request: SummaryRequest) -> SummaryResponse:
+SUMMARY_PREVIEW_MODEL = "grok-3-fast-latest"
+# Summaries at temperature 0.3 are near-deterministic, so identical content can be
+# served from memory instead of re-spending a Grok call.
+SUMMARY_PREVIEW_CACHE_MAX = int(os.getenv("SUMMARY_PREVIEW_CACHE_MAX", "10000"))
+_summary_preview_cache: OrderedDict[str, str] = OrderedDict()
+# Single-flight: concurrent requests for the same key await the first caller's result
+_summary_preview_inflight: dict[str, asyncio.Future] = {}
+
+# Content under this approximate token count (len/4) is summarized locally by
+# taking the lead sentences instead of calling Grok
+SUMMARY_LOCAL_TOKEN_THRESHOLD = int(os.getenv("SUMMARY_LOCAL_TOKEN_THRESHOLD", "200"))
+
+# Backpressure: cap in-flight Grok summary calls at the connection-pool budget so a
+# surge queues briefly instead of thrashing the pool with 30s awaits
+_GROK_SEMA = asyncio.Semaphore(int(os.getenv("GROK_MAX_CONCURRENCY", "128")))
+
+# Per-caller limiter: shed abusive clients before they consume a connection slot
+# and a paid Grok call
+SUMMARY_RATE_WINDOW_SECONDS = int(os.getenv("SUMMARY_RATE_WINDOW", "60"))
+SUMMARY_RATE_MAX_REQUESTS = int(os.getenv("SUMMARY_RATE_MAX", "30"))
+_summary_rate_calls: dict[str, deque] = {}
+
+
+def _summary_rate_limited(caller: str) -> bool:
+    """Sliding-window check per caller IP; True when the caller is over budget."""
+    now = time.time()
+    calls = _summary_rate_calls.setdefault(caller, deque())
+    while calls and (now - calls[0] > SUMMARY_RATE_WINDOW_SECONDS):
+        calls.popleft()
+    if len(calls) >= SUMMARY_RATE_MAX_REQUESTS:
+        return True
+    calls.append(now)
+    return False
+
+
+_SUMMARY_SYSTEM_PROMPT = """You are Grokipedia's article summarizer. Your task is to provide clear, informative summaries that help readers quickly understand the key points of an article.
+
+Guidelines:
+- Write 2-3 concise sentences capturing the main points
+- Focus on facts, key findings, or central arguments
+- Use neutral, encyclopedic tone
+- Don't start with "This article..." or "The article..."
+- Go straight to the substance"""
+
+# Invariant parts of the Grok request, built once; only the user message changes
+_SUMMARY_SYSTEM_MSG = {"role": "system", "content": _SUMMARY_SYSTEM_PROMPT}
+_SUMMARY_BASE_PAYLOAD = {
+    "model": SUMMARY_PREVIEW_MODEL,
+    "temperature": 0.3,
+    "max_tokens": 200,
+}
+
+
+@app.post("/api/summarize-preview", response_model=None)
+async def summarize_preview(request: SummaryRequest, http_request: Request, stream: bool = False) -> SummaryResponse | StreamingResponse:
     """Generate a Grok summary of article content."""
-    if not request.content or len(request.content.strip()) < 50:
+    # Check raw length first: len() is O(1) while .strip() copies the whole body,
+    # so large payloads never pay for a full-string copy just to pass the guard.
+    if not request.content or len(request.content) < 50 or not request.content.strip():
         return SummaryResponse(
             summary="",
             error="Content too short to summarize"
@@ -1690,55 +2233,137 @@ async def summarize_preview(request: SummaryRequest) -> SummaryResponse:
 
     # Truncate content if too long (keep first ~8000 chars for context)
     content = request.content[:8000]
-    title_context = f'Article: "{request.title}"\n\n' if request.title else ""
 
-    system_prompt = """You are Grokipedia's article summarizer. Your task is to provide clear, informative summaries that help readers quickly understand the key points of an article.
+    # Short articles: a lead-sentence extract on-CPU beats a multi-second LLM round
+    # trip for content that barely exceeds the summary length anyway.
+    if len(content) // 4 < SUMMARY_LOCAL_TOKEN_THRESHOLD:
+        lead = " ".join(re.split(r'(?<=[.!?])\s+', content.strip())[:3]).strip()
+        if lead:
+            if stream:
+                return StreamingResponse(iter([lead]), media_type="text/event-stream")
+            return SummaryResponse(summary=lead)
 
-Guidelines:
-- Write 2-3 concise sentences capturing the main points
-- Focus on facts, key findings, or central arguments
-- Use neutral, encyclopedic tone
-- Don't start with "This article..." or "The article..."
-- Go straight to the substance"""
+    title_context = f'Article: "{request.title}"\n\n' if request.title else ""
+
+    cache_key = hashlib.sha256(
+        f"{SUMMARY_PREVIEW_MODEL}|{request.title or ''}|{content}".encode()
+    ).hexdigest()
+    cached = _summary_preview_cache.get(cache_key)
+    if cached is not None:
+        _summary_preview_cache.move_to_end(cache_key)
+        if stream:
+            return StreamingResponse(iter([cached]), media_type="text/event-stream")
+        return SummaryResponse(summary=cached)
+
+    # Coalesce duplicate in-flight requests (e.g. a page loading many identical
+    # previews at once) into a single upstream Grok call.
+    fut: asyncio.Future | None = None
+    if not stream:
+        existing = _summary_preview_inflight.get(cache_key)
+        if existing is not None:
+            return await existing
+
+    # Rate-limit only calls that would actually hit Grok (cache hits and joined
+    # in-flight requests cost nothing upstream)
+    caller = http_request.client.host if http_request.client else "unknown"
+    if _summary_rate_limited(caller):
+        raise HTTPException(status_code=429, detail="Rate limit exceeded for summary endpoint. Please try again later.")
+
+    if not stream:
+        fut = asyncio.get_running_loop().create_future()
+        _summary_preview_inflight[cache_key] = fut
 
     user_prompt = f"""{title_context}Summarize the following article content:
 
 {content}"""
 
+    payload = {
+        **_SUMMARY_BASE_PAYLOAD,
+        "messages": [_SUMMARY_SYSTEM_MSG, {"role": "user", "content": user_prompt}],
+    }
+    headers = _GROK_HEADERS
+
+    if stream:
+        # SSE path: forward content deltas as they arrive so the frontend can render
+        # progressively instead of waiting for the final token.
+        async def _stream_summary():
+            client = _get_http_client()
+            parts: list[str] = []
+            try:
+                async with _GROK_SEMA, client.stream(
+                    "POST",
+                    "https://api.x.ai/v1/chat/completions",
+                    headers=headers,
+                    json={**payload, "stream": True},
+                    timeout=30.0,
+                ) as resp:
+                    resp.raise_for_status()
+                    async for line in resp.aiter_lines():
+                        if not line.startswith("data: "):
+                            continue
+                        chunk = line[len("data: "):]
+                        if chunk.strip() == "[DONE]":
+                            break
+                        try:
+                            delta = orjson.loads(chunk)["choices"][0].get("delta", {}).get("content")
+                        except Exception:
+                            continue
+                        if delta:
+                            parts.append(delta)
+                            yield delta
+            except httpx.HTTPError:
+                return
+            summary = "".join(parts).strip()
+            if summary:
+                _summary_preview_cache[cache_key] = summary
+                if len(_summary_preview_cache) > SUMMARY_PREVIEW_CACHE_MAX:
+                    _summary_preview_cache.popitem(last=False)
+
+        return StreamingResponse(_stream_summary(), media_type="text/event-stream")
+
+    resp: SummaryResponse | None = None
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
+        client = _get_http_client()
+        # Serialize/parse via orjson: the 8000-char content escape runs in C instead
+        # of the stdlib's per-character Python encoder.
+        async with _GROK_SEMA:
             response = await client.post(
                 "https://api.x.ai/v1/chat/completions",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {GROK_API_KEY}"
-                },
-                json={
-                    "messages": [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ],
-                    "model": "grok-3-fast-latest",
-                    "temperature": 0.3,
-                    "max_tokens": 200
-                }
+                headers=headers,
+                content=orjson.dumps(payload),
+                timeout=30.0,
             )
-            response.raise_for_status()
-            result = response.json()
-
-        summary = result["choices"][0]["message"]["content"].strip()
-        return SummaryResponse(summary=summary)
+        response.raise_for_status()
+        # Pull out the single field we need; the rest of the reply (usage, ids,
+        # finish_reason) is garbage-collected immediately instead of living on
+        summary = orjson.loads(response.content)["choices"][0]["message"]["content"].strip()
+        _summary_preview_cache[cache_key] = summary
+        if len(_summary_preview_cache) > SUMMARY_PREVIEW_CACHE_MAX:
+            _summary_preview_cache.popitem(last=False)
+        resp = SummaryResponse(summary=summary)
 
     except httpx.TimeoutException:
-        return SummaryResponse(
+        resp = SummaryResponse(
             summary="",
             error="Summary request timed out"
         )
     except Exception as e:
-        return SummaryResponse(
+        resp = SummaryResponse(
             summary="",
             error=f"Failed to generate summary: {str(e)}"
         )
+    finally:
+        if fut is not None:
+            _summary_preview_inflight.pop(cache_key, None)
+            # Resolve the future here so joiners never hang: if we were
+            # cancelled before producing a response, propagate cancellation
+            if not fut.done():
+                if resp is not None:
+                    fut.set_result(resp)
+                else:
+                    fut.cancel()
+
+    return resp
 
 
 # --- Article Graph Endpoint ---
@@ -1783,8 +2408,8 @@ def get_article_graph(article_id: str | None = None) -> ArticleGraphResponse:
             detail="Graph data not found. Please run generate_article_graph.py to generate the graph."
         )
     
-    with open(GRAPH_FILE, 'r', encoding='utf-8') as f:
-        graph = json.load(f)
+    with open(GRAPH_FILE, 'rb') as f:
+        graph = orjson.loads(f.read())
     
     # If article_id (slug) is provided, filter to show only connected nodes
     if article_id:
@@ -1815,3 +2440,12 @@ def get_article_graph(article_id: str | None = None) -> ArticleGraphResponse:
         center_node=graph.get('center_node'),
         stats=graph.get('stats')
     )
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop + httptools: C event loop and HTTP parser instead of asyncio + h11.
+    # `uvicorn main:app` picks both up automatically once installed (loop="auto");
+    # this entrypoint just makes the choice explicit.
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
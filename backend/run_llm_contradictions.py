@@ -18,11 +18,19 @@ Notes:
     and record offsets/line numbers for UI highlighting.
 """
 
+import concurrent.futures
+import functools
+import hashlib
 import json
 import os
+import random
+import sqlite3
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List
 
+import orjson
 import requests
 
 
@@ -34,25 +42,109 @@ MODEL = os.environ.get("XAI_MODEL", "grok-4-1-fast-reasoning")
 REASONING_EFFORT = os.environ.get("XAI_REASONING_EFFORT", "high")
 MAX_ARTICLE_CHARS = 1600  # trim each article to keep prompt size reasonable
 TIMEOUT_SECONDS = 300  # reasoning models can take longer
+CONNECT_TIMEOUT_SECONDS = 10.0
+IDLE_TIMEOUT_SECONDS = 30.0  # abort a stream that goes silent this long
+# Cap runaway completions; contradiction lists are short
+MAX_OUTPUT_TOKENS = int(os.environ.get("XAI_MAX_OUTPUT_TOKENS", "1024"))
+MAX_RETRIES = 3
+RETRY_BASE_SECONDS = 2.0
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Account limits; sized so we throttle ourselves instead of eating 429s
+XAI_RPM = int(os.environ.get("XAI_RPM", "60"))
+XAI_TPM = int(os.environ.get("XAI_TPM", "100000"))
+
+
+class RateLimiter:
+    """Request-per-minute and token-per-minute buckets shared across workers.
+
+    Sleeping before we send beats retrying after a 429 — at the provider cap,
+    retry wait dominates wall time for batch jobs like this one.
+    """
+
+    def __init__(self, requests_per_min: int, tokens_per_min: int):
+        self.rpm = requests_per_min
+        self.tpm = tokens_per_min
+        self._requests = float(requests_per_min)
+        self._tokens = float(tokens_per_min)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> None:
+        """Block until both buckets can cover one request of `tokens` tokens."""
+        tokens = min(tokens, self.tpm)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last
+                self._last = now
+                self._requests = min(float(self.rpm), self._requests + elapsed * self.rpm / 60.0)
+                self._tokens = min(float(self.tpm), self._tokens + elapsed * self.tpm / 60.0)
+                if self._requests >= 1.0 and self._tokens >= tokens:
+                    self._requests -= 1.0
+                    self._tokens -= tokens
+                    return
+                wait = max(
+                    (1.0 - self._requests) * 60.0 / self.rpm,
+                    (tokens - self._tokens) * 60.0 / self.tpm,
+                )
+            time.sleep(max(wait, 0.05))
+
+
+_limiter = RateLimiter(XAI_RPM, XAI_TPM)
+
+# requests.Session is not thread-safe, so each worker keeps its own; the
+# session reuses its TLS connection across that worker's calls instead of
+# handshaking per request
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+
+# On-disk response cache so reruns only call the API for changed clusters
+CACHE_DB = Path(__file__).parent / "xai_cache.db"
+
+
+def _get_cache_conn() -> sqlite3.Connection:
+    # sqlite3 connections can't cross threads, so each worker opens its own;
+    # WAL mode lets them read and write concurrently
+    conn = getattr(_thread_local, "cache_conn", None)
+    if conn is None:
+        conn = sqlite3.connect(CACHE_DB)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS responses (k BLOB PRIMARY KEY, v TEXT)")
+        _thread_local.cache_conn = conn
+    return conn
+
+
+def _cache_key(messages: List[Dict[str, str]]) -> bytes:
+    material = orjson.dumps(
+        {"model": MODEL, "effort": REASONING_EFFORT, "messages": messages},
+        option=orjson.OPT_SORT_KEYS,
+    )
+    return hashlib.blake2b(material, digest_size=16).digest()
 
 
 def load_articles() -> Dict[str, Dict[str, str]]:
-    data = json.loads(ARTICLES_FILE.read_text())
+    data = orjson.loads(ARTICLES_FILE.read_bytes())
     by_url: Dict[str, Dict[str, str]] = {}
     for item in data:
         by_url[item["url"]] = {
             "title": item.get("title", ""),
-            "content": item.get("content", ""),
+            # Trim at load: only the excerpt ever reaches the prompt or the
+            # offset search, so full bodies never stay resident
+            "content": item.get("content", "")[:MAX_ARTICLE_CHARS],
         }
     return by_url
 
 
 def load_clusters() -> List[Dict]:
-    return json.loads(CLUSTERS_FILE.read_text())
-
-
-def trim_content(text: str, limit: int = MAX_ARTICLE_CHARS) -> str:
-    return text[:limit]
+    return orjson.loads(CLUSTERS_FILE.read_bytes())
 
 
 def build_messages(cluster: Dict, articles_by_url: Dict[str, Dict[str, str]]) -> List[Dict[str, str]]:
@@ -64,7 +156,7 @@ def build_messages(cluster: Dict, articles_by_url: Dict[str, Dict[str, str]]) ->
             {
                 "title": art.get("title", ""),
                 "url": url,
-                "content": trim_content(art.get("content", "")),
+                "content": art.get("content", ""),
             }
         )
 
@@ -99,25 +191,91 @@ def build_messages(cluster: Dict, articles_by_url: Dict[str, Dict[str, str]]) ->
     ]
 
 
+def _read_stream(resp: requests.Response) -> str:
+    """Accumulate streamed delta chunks; stop early once a JSON array is complete."""
+    pieces: List[str] = []
+    for line in resp.iter_lines(decode_unicode=True):
+        if not line or not line.startswith("data: "):
+            continue
+        data = line[len("data: "):]
+        if data == "[DONE]":
+            break
+        try:
+            chunk = json.loads(data)
+        except json.JSONDecodeError:
+            continue
+        delta = chunk.get("choices", [{}])[0].get("delta", {}).get("content")
+        if not delta:
+            continue
+        pieces.append(delta)
+        # Cheap completeness check: only attempt a full parse when the tail
+        # looks like it just closed the top-level array
+        if delta.rstrip().endswith("]"):
+            text = "".join(pieces).strip()
+            try:
+                parsed = json.loads(text)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(parsed, list):
+                break
+    return "".join(pieces)
+
+
 def call_xai(messages: List[Dict[str, str]], api_key: str) -> str:
+    key = _cache_key(messages)
+    conn = _get_cache_conn()
+    row = conn.execute("SELECT v FROM responses WHERE k = ?", (key,)).fetchone()
+    if row is not None:
+        return row[0]
     payload = {
         "model": MODEL,
         "messages": messages,
         "reasoning": {"effort": REASONING_EFFORT},  # matches working notebook
+        "max_tokens": MAX_OUTPUT_TOKENS,
+        "stream": True,
     }
-    resp = requests.post(
-        "https://api.x.ai/v1/chat/completions",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}",
-        },
-        json=payload,
-        timeout=TIMEOUT_SECONDS,
-    )
-    if resp.status_code != 200:
-        raise RuntimeError(f"HTTP {resp.status_code}: {resp.text}")
-    parsed = resp.json()
-    return parsed["choices"][0]["message"]["content"]
+    # Rough input estimate (~4 chars/token) plus the output budget
+    token_estimate = sum(len(m["content"]) for m in messages) // 4 + MAX_OUTPUT_TOKENS
+    last_error = None
+    for attempt in range(MAX_RETRIES + 1):
+        if attempt:
+            # Exponential backoff with jitter so parallel workers don't retry in lockstep
+            time.sleep(RETRY_BASE_SECONDS * (2 ** (attempt - 1)) + random.random())
+        _limiter.acquire(token_estimate)
+        try:
+            resp = _get_session().post(
+                "https://api.x.ai/v1/chat/completions",
+                headers={
+                    "Content-Type": "application/json",
+                    "Authorization": f"Bearer {api_key}",
+                },
+                json=payload,
+                stream=True,
+                # Read timeout applies between chunks, so a silent stream
+                # dies after IDLE_TIMEOUT_SECONDS rather than hanging
+                timeout=(CONNECT_TIMEOUT_SECONDS, IDLE_TIMEOUT_SECONDS),
+            )
+        except (requests.Timeout, requests.ConnectionError) as e:
+            last_error = e
+            continue
+        try:
+            if resp.status_code in _RETRYABLE_STATUS:
+                last_error = RuntimeError(f"HTTP {resp.status_code}: {resp.text}")
+                continue
+            if resp.status_code != 200:
+                raise RuntimeError(f"HTTP {resp.status_code}: {resp.text}")
+            try:
+                content = _read_stream(resp)
+            except requests.RequestException as e:
+                # Stream dropped or went idle mid-response; retry the call
+                last_error = e
+                continue
+            conn.execute("INSERT OR REPLACE INTO responses (k, v) VALUES (?, ?)", (key, content))
+            conn.commit()
+            return content
+        finally:
+            resp.close()
+    raise RuntimeError(f"giving up after {MAX_RETRIES} retries: {last_error}")
 
 
 def find_offset(content: str, snippet: str) -> Dict[str, int]:
@@ -144,7 +302,7 @@ def parse_llm_response(content: str, cluster: Dict, articles_by_url: Dict[str, D
         return {"raw": content}
 
     by_url_fulltext = {
-        m["url"]: trim_content(articles_by_url.get(m["url"], {}).get("content", ""))
+        m["url"]: articles_by_url.get(m["url"], {}).get("content", "")
         for m in cluster["members"]
     }
 
@@ -174,6 +332,22 @@ def parse_llm_response(content: str, cluster: Dict, articles_by_url: Dict[str, D
     return {"contradictions": enriched}
 
 
+def process_cluster(cluster: Dict, articles_by_url: Dict[str, Dict[str, str]], api_key: str) -> Dict:
+    messages = build_messages(cluster, articles_by_url)
+    try:
+        content = call_xai(messages, api_key)
+    except Exception as e:
+        content = f"ERROR: {e}"
+    parsed = parse_llm_response(content, cluster, articles_by_url)
+    return {
+        "cluster_id": cluster["cluster_id"],
+        "size": cluster["size"],
+        "members": cluster["members"],
+        "llm_response": content,
+        "parsed": parsed,
+    }
+
+
 def main() -> None:
     api_key = os.environ.get("XAI_API_KEY")
     if not api_key:
@@ -183,30 +357,20 @@ def main() -> None:
     clusters = load_clusters()
 
     # Run LLM calls in parallel (I/O bound)
-    import concurrent.futures
-
-    def process_cluster(cluster: Dict) -> Dict:
-        messages = build_messages(cluster, articles_by_url)
-        try:
-            content = call_xai(messages, api_key)
-        except Exception as e:
-            content = f"ERROR: {e}"
-        parsed = parse_llm_response(content, cluster, articles_by_url)
-        return {
-            "cluster_id": cluster["cluster_id"],
-            "size": cluster["size"],
-            "members": cluster["members"],
-            "llm_response": content,
-            "parsed": parsed,
-        }
+    worker = functools.partial(process_cluster, articles_by_url=articles_by_url, api_key=api_key)
 
     to_process = [c for c in clusters if c.get("size", 0) > 1]
     results = []
     with concurrent.futures.ThreadPoolExecutor(max_workers=10) as ex:
-        for res in ex.map(process_cluster, to_process):
-            results.append(res)
-
-    OUTPUT_FILE.write_text(json.dumps(results, indent=2))
+        # as_completed collects whichever cluster finishes first, so one slow
+        # reasoning call doesn't hold up results from the other workers
+        futures = [ex.submit(worker, c) for c in to_process]
+        for fut in concurrent.futures.as_completed(futures):
+            results.append(fut.result())
+
+    # Keep output deterministic regardless of completion order
+    results.sort(key=lambda r: r["cluster_id"])
+    OUTPUT_FILE.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
     print(f"[done] wrote {len(results)} cluster results to {OUTPUT_FILE}")
 
 
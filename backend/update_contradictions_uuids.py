@@ -3,9 +3,10 @@
 Update contradictions_llm.json to use UUIDs instead of slugs in URLs.
 """
 
-import json
 from pathlib import Path
 
+import orjson
+
 ARTICLES_FILE = Path(__file__).parent / "all_articles_short.json"
 CONTRADICTIONS_FILE = Path(__file__).parent / "contradictions_llm.json"
 
@@ -13,8 +14,7 @@ CONTRADICTIONS_FILE = Path(__file__).parent / "contradictions_llm.json"
 def load_articles() -> dict:
     """Load articles and create a mapping from URL to UUID."""
     print(f"Loading articles from {ARTICLES_FILE}...")
-    with open(ARTICLES_FILE, 'r', encoding='utf-8') as f:
-        articles = json.load(f)
+    articles = orjson.loads(ARTICLES_FILE.read_bytes())
     
     # Create mapping: URL -> UUID
     url_to_uuid = {}
@@ -28,76 +28,51 @@ def load_articles() -> dict:
     return url_to_uuid
 
 
-def update_url_to_uuid(url: str, url_to_uuid: dict) -> str:
-    """Convert a URL to use UUID instead of slug."""
-    if not url.startswith('https://grokipedia.com/page/'):
-        return url  # Not a grokipedia URL, return as-is
-    
-    # Extract the slug part
-    slug = url.replace('https://grokipedia.com/page/', '')
-    
-    # Find the UUID for this URL
-    uuid = url_to_uuid.get(url)
-    if uuid:
-        return f"https://grokipedia.com/page/{uuid}"
-    else:
-        print(f"Warning: No UUID found for URL: {url}")
-        return url  # Return original if no UUID found
+GROKIPEDIA_PREFIX = 'https://grokipedia.com/page/'
 
 
 def update_contradictions(url_to_uuid: dict):
     """Update contradictions file to use UUIDs in URLs."""
     print(f"\nLoading contradictions from {CONTRADICTIONS_FILE}...")
-    with open(CONTRADICTIONS_FILE, 'r', encoding='utf-8') as f:
-        contradictions = json.load(f)
-    
+    contradictions = orjson.loads(CONTRADICTIONS_FILE.read_bytes())
+
     updated_count = 0
-    not_found_count = 0
-    
+    missing = []
+    lookup = url_to_uuid.get
+    # URLs already in UUID form (e.g. on a re-run) need no lookup or warning
+    uuid_urls = {f"{GROKIPEDIA_PREFIX}{uuid}" for uuid in url_to_uuid.values()}
+
+    def rewrite(obj: dict, key: str):
+        """Swap a grokipedia slug URL for its UUID form, counting the outcome."""
+        nonlocal updated_count
+        old_url = obj.get(key, '')
+        if not old_url or old_url in uuid_urls:
+            return
+        uuid = lookup(old_url)
+        if uuid:
+            obj[key] = f"{GROKIPEDIA_PREFIX}{uuid}"
+            updated_count += 1
+        elif old_url.startswith(GROKIPEDIA_PREFIX):
+            missing.append(old_url)
+
     for cluster in contradictions:
         # Update member URLs
         for member in cluster.get('members', []):
-            old_url = member.get('url', '')
-            if old_url:
-                new_url = update_url_to_uuid(old_url, url_to_uuid)
-                if new_url != old_url:
-                    member['url'] = new_url
-                    updated_count += 1
-                elif old_url.startswith('https://grokipedia.com/page/'):
-                    not_found_count += 1
-        
+            rewrite(member, 'url')
+
         # Update contradiction URLs
-        parsed = cluster.get('parsed', {})
-        contradictions_list = parsed.get('contradictions', [])
-        for contradiction in contradictions_list:
-            # Update article_a_url
-            old_url_a = contradiction.get('article_a_url', '')
-            if old_url_a:
-                new_url_a = update_url_to_uuid(old_url_a, url_to_uuid)
-                if new_url_a != old_url_a:
-                    contradiction['article_a_url'] = new_url_a
-                    updated_count += 1
-                elif old_url_a.startswith('https://grokipedia.com/page/'):
-                    not_found_count += 1
-            
-            # Update article_b_url
-            old_url_b = contradiction.get('article_b_url', '')
-            if old_url_b:
-                new_url_b = update_url_to_uuid(old_url_b, url_to_uuid)
-                if new_url_b != old_url_b:
-                    contradiction['article_b_url'] = new_url_b
-                    updated_count += 1
-                elif old_url_b.startswith('https://grokipedia.com/page/'):
-                    not_found_count += 1
-    
+        for contradiction in cluster.get('parsed', {}).get('contradictions', []):
+            rewrite(contradiction, 'article_a_url')
+            rewrite(contradiction, 'article_b_url')
+
     print(f"\nUpdated {updated_count} URLs")
-    if not_found_count > 0:
-        print(f"Warning: {not_found_count} URLs could not be found in articles")
+    if missing:
+        # One summary line instead of a print per missing URL
+        print(f"Warning: {len(missing)} URLs could not be found in articles; first 5: {missing[:5]}")
     
     # Write back to file
     print(f"\nWriting updated contradictions to {CONTRADICTIONS_FILE}...")
-    with open(CONTRADICTIONS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(contradictions, f, indent=2, ensure_ascii=False)
+    CONTRADICTIONS_FILE.write_bytes(orjson.dumps(contradictions, option=orjson.OPT_INDENT_2))
     
     print("Done!")
 